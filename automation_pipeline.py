@@ -7,14 +7,23 @@ Designed for external triggering (Control-M, cron, etc.) and repeatable executio
 """
 
 import os
+import re
 import sys
 import json
+import shutil
 import logging
 import argparse
-import glob
+import fnmatch
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, Any, List, Optional
-import traceback
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+try:
+    from tqdm import tqdm
+    from tqdm.contrib.logging import logging_redirect_tqdm
+except ImportError:  # optional progress bar for multi-file runs
+    tqdm = None
 
 # imports
 from excel_to_json_converter import convert_excel_to_json
@@ -22,6 +31,35 @@ from data_accessor import ExcelDataAccessor
 from enhanced_terraform_generator import EnhancedTerraformGenerator
 from enhanced_terraform_generator_v2 import EnhancedTerraformGeneratorV2
 
+# banner line shared by the pipeline's start/finish log records
+_BAR = "=" * 80
+
+# runs of characters not allowed in directory names (underscores included,
+# so existing underscore runs collapse in the same pass)
+_DIR_NAME_UNSAFE_RE = re.compile(r'(?:[^\w\-]|_)+')
+
+
+def _extract_one(excel_file: str, values_only: bool = False) -> Tuple[str, Optional[str], Optional[str]]:
+    """Extract a single Excel file to JSON in a worker process.
+    
+    Kept at module scope so it can be pickled by ProcessPoolExecutor.
+    Returns (excel_file, json_file or None, error message or None).
+    """
+    try:
+        base_name = os.path.splitext(os.path.basename(excel_file))[0]
+        json_file = f"{base_name}_comprehensive_data.json"
+        output_file = convert_excel_to_json(
+            excel_file, json_file,
+            verbose=False,
+            reader_opts={'read_only': True, 'data_only': True},
+            values_only=values_only
+        )
+        if output_file and os.path.exists(output_file):
+            return excel_file, output_file, None
+        return excel_file, None, "Failed to create JSON file"
+    except Exception as e:
+        return excel_file, None, f"Excel extraction failed: {e}"
+
 class AutomationPipeline:
     """Complete automation pipeline for Excel to Terraform conversion."""
     
@@ -47,7 +85,8 @@ class AutomationPipeline:
                 "extract_macros": True,
                 "extract_formulas": True,
                 "extract_comments": True,
-                "validate_data": True
+                "validate_data": True,
+                "max_workers": None
             },
             "output": {
                 "json_file": "comprehensive_excel_data.json",
@@ -133,6 +172,31 @@ class AutomationPipeline:
         
         return logger
     
+    def _scan_excel_files(self, directory: str, file_pattern: str) -> List[str]:
+        """List regular files in a directory matching a pattern in one scandir pass."""
+        pattern = file_pattern.lower()
+        with os.scandir(directory) as entries:
+            excel_files = [entry.path for entry in entries
+                           if entry.is_file(follow_symlinks=False)
+                           and not entry.name.startswith('~$')
+                           and fnmatch.fnmatch(entry.name.lower(), pattern)]
+        return sorted(excel_files)
+    
+    def _prefetch_files(self, excel_files: List[str]):
+        """Ask the kernel to start reading every discovered file ahead of processing."""
+        if len(excel_files) < 2 or not hasattr(os, 'posix_fadvise'):
+            return  # nothing to overlap, or not supported (e.g. Windows)
+        
+        for excel_file in excel_files:
+            try:
+                fd = os.open(excel_file, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass  # prefetch is only a hint
+    
     def _discover_excel_files(self) -> List[str]:
         """Discover Excel files to process based on configuration."""
         excel_files = []
@@ -147,9 +211,7 @@ class AutomationPipeline:
                 return excel_files
             
             # Find all Excel files matching the pattern
-            pattern = os.path.join(input_dir, file_pattern)
-            excel_files = glob.glob(pattern)
-            excel_files = [f for f in excel_files if os.path.isfile(f) and not os.path.basename(f).startswith('~$')]
+            excel_files = self._scan_excel_files(input_dir, file_pattern)
             
             self.logger.info(f"Found {len(excel_files)} Excel files in {input_dir}")
             for file in excel_files:
@@ -167,9 +229,7 @@ class AutomationPipeline:
                 self.logger.info("No specific file provided, searching sourcefiles directory for Excel files...")
                 sourcefiles_dir = "sourcefiles"
                 if os.path.exists(sourcefiles_dir):
-                    pattern = os.path.join(sourcefiles_dir, "*.xls*")
-                    excel_files = glob.glob(pattern)
-                    excel_files = [f for f in excel_files if os.path.isfile(f)]
+                    excel_files = self._scan_excel_files(sourcefiles_dir, "*.xls*")
                     
                     if excel_files:
                         self.logger.info(f"Found {len(excel_files)} Excel file(s) in sourcefiles directory")
@@ -184,9 +244,9 @@ class AutomationPipeline:
     
     def run(self) -> Dict[str, Any]:
         """Run the complete automation pipeline."""
-        self.logger.info("=" * 80)
+        self.logger.info(_BAR)
         self.logger.info("EXCEL TO TERRAFORM AUTOMATION PIPELINE")
-        self.logger.info("=" * 80)
+        self.logger.info(_BAR)
         self.logger.info(f"Started at: {self.start_time}")
         self.logger.info(f"Configuration: {self.config_file}")
         
@@ -212,9 +272,11 @@ class AutomationPipeline:
             results['steps_completed'].append('validation')
             self.logger.info("SUCCESS: Input validation completed")
             
-            # Discover Excel files to process
-            excel_files = self._discover_excel_files()
-            self.logger.info(f"Processing {len(excel_files)} Excel file(s)")
+            # Reuse the files discovered during validation
+            excel_files = validation_result['excel_files']
+            total = len(excel_files)
+            self.logger.info(f"Processing {total} Excel file(s)")
+            self._prefetch_files(excel_files)
             
             # Step 2: Backup previous outputs if configured
             if self.config['output']['backup_previous']:
@@ -223,38 +285,54 @@ class AutomationPipeline:
                 results['steps_completed'].append('backup')
                 self.logger.info("SUCCESS: Previous outputs backed up")
             
+            # Extract independent files in parallel worker processes up front
+            max_workers = self.config['processing'].get('max_workers') or os.cpu_count() or 1
+            extracted = {}
+            if total > 1 and max_workers > 1:
+                self.logger.info(f"Step 3: Extracting {total} Excel files with {max_workers} workers...")
+                extracted = self._extract_excel_data_parallel(excel_files, max_workers)
+            
             # Process each Excel file
             processed_files = []
-            for i, excel_file in enumerate(excel_files, 1):
-                self.logger.info(f"Processing file {i}/{len(excel_files)}: {os.path.basename(excel_file)}")
-                
-                # Step 3: Extract Excel data to JSON
-                self.logger.info(f"Step 3.{i}: Extracting Excel data to JSON...")
-                json_result = self._extract_excel_data(excel_file)
-                if not json_result['success']:
-                    results['errors'].extend(json_result['errors'])
-                    self.logger.error(f"Failed to process {excel_file}: {json_result['errors']}")
-                    continue
-                results['steps_completed'].append(f'excel_extraction_{i}')
-                results['files_generated'].append(json_result['json_file'])
-                self.logger.info(f"SUCCESS: Excel data extracted to: {json_result['json_file']}")
-                
-                # Step 4: Generate Terraform files
-                self.logger.info(f"Step 4.{i}: Generating Terraform files...")
-                terraform_result = self._generate_terraform_files(json_result['json_file'], excel_file)
-                if not terraform_result['success']:
-                    results['errors'].extend(terraform_result['errors'])
-                    self.logger.error(f"Failed to generate Terraform for {excel_file}: {terraform_result['errors']}")
-                    continue
-                results['steps_completed'].append(f'terraform_generation_{i}')
-                results['files_generated'].extend(terraform_result['files'])
-                self.logger.info(f"SUCCESS: Terraform files generated in: {terraform_result['output_dir']}")
-                
-                processed_files.append({
-                    'excel_file': excel_file,
-                    'json_file': json_result['json_file'],
-                    'terraform_dir': terraform_result['output_dir']
-                })
+            use_bar = tqdm is not None and total > 1
+            progress = tqdm(excel_files, unit="file", mininterval=0.5, disable=None) if use_bar else excel_files
+            # the bar already shows position, so per-file headers drop to debug with it
+            log_header = self.logger.debug if use_bar else self.logger.info
+            # route console log records through tqdm.write so they do not break the bar
+            with logging_redirect_tqdm(loggers=[self.logger]) if use_bar else contextlib.nullcontext():
+                for i, excel_file in enumerate(progress, 1):
+                    name = os.path.basename(excel_file)
+                    log_header(f"Processing file {i}/{total}: {name}")
+                    
+                    # Step 3: Extract Excel data to JSON
+                    json_result = extracted.get(excel_file)
+                    if json_result is None:
+                        self.logger.info(f"Step 3.{i}: Extracting Excel data to JSON...")
+                        json_result = self._extract_excel_data(excel_file)
+                    if not json_result['success']:
+                        results['errors'].extend(json_result['errors'])
+                        self.logger.error(f"Failed to process {name}: {json_result['errors']}")
+                        continue
+                    results['steps_completed'].append(f'excel_extraction_{i}')
+                    results['files_generated'].append(json_result['json_file'])
+                    self.logger.info(f"SUCCESS: Excel data extracted to: {json_result['json_file']}")
+                    
+                    # Step 4: Generate Terraform files
+                    self.logger.info(f"Step 4.{i}: Generating Terraform files...")
+                    terraform_result = self._generate_terraform_files(json_result['json_file'], excel_file)
+                    if not terraform_result['success']:
+                        results['errors'].extend(terraform_result['errors'])
+                        self.logger.error(f"Failed to generate Terraform for {name}: {terraform_result['errors']}")
+                        continue
+                    results['steps_completed'].append(f'terraform_generation_{i}')
+                    results['files_generated'].extend(terraform_result['files'])
+                    self.logger.info(f"SUCCESS: Terraform files generated in: {terraform_result['output_dir']}")
+                    
+                    processed_files.append({
+                        'excel_file': excel_file,
+                        'json_file': json_result['json_file'],
+                        'terraform_dir': terraform_result['output_dir']
+                    })
             
             if not processed_files:
                 results['errors'].append("No files were successfully processed")
@@ -286,16 +364,16 @@ class AutomationPipeline:
             # Check if we successfully processed any files
             if processed_files:
                 results['success'] = True
-                self.logger.info("=" * 80)
+                self.logger.info(_BAR)
                 self.logger.info("AUTOMATION PIPELINE COMPLETED SUCCESSFULLY!")
-                self.logger.info("=" * 80)
+                self.logger.info(_BAR)
             else:
                 results['success'] = False
                 if not results['errors']:
                     results['errors'].append("No files were successfully processed")
-                self.logger.info("=" * 80)
+                self.logger.info(_BAR)
                 self.logger.error("AUTOMATION PIPELINE FAILED!")
-                self.logger.info("=" * 80)
+                self.logger.info(_BAR)
             
             self.logger.info(f"Files processed: {len(processed_files)}")
             self.logger.info(f"Files generated: {len(results['files_generated'])}")
@@ -304,8 +382,7 @@ class AutomationPipeline:
             
         except Exception as e:
             error_msg = f"Pipeline failed with exception: {e}"
-            self.logger.error(error_msg)
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(error_msg)
             results['errors'].append(error_msg)
             
         finally:
@@ -324,10 +401,11 @@ class AutomationPipeline:
     
     def _validate_inputs(self) -> Dict[str, Any]:
         """Validate input files and configuration."""
-        result = {'success': True, 'errors': []}
+        result = {'success': True, 'errors': [], 'excel_files': []}
         
-        # Discover Excel files to process
+        # Discover Excel files to process (discovery already confirmed they exist)
         excel_files = self._discover_excel_files()
+        result['excel_files'] = excel_files
         
         if not excel_files:
             result['success'] = False
@@ -342,11 +420,6 @@ class AutomationPipeline:
         
         # Validate each Excel file
         for excel_file in excel_files:
-            if not os.path.exists(excel_file):
-                result['success'] = False
-                result['errors'].append(f"Excel file not found: {excel_file}")
-                continue
-            
             # Check if file is readable
             try:
                 with open(excel_file, 'rb') as f:
@@ -356,15 +429,12 @@ class AutomationPipeline:
                 result['errors'].append(f"Cannot read Excel file {excel_file}: {e}")
                 continue
         
-        # Check output directory permissions
+        # Check output directory permissions once for the whole run
         terraform_dir = self.config['output']['terraform_dir']
         try:
             os.makedirs(terraform_dir, exist_ok=True)
-            # Test write permissions
-            test_file = os.path.join(terraform_dir, '.write_test')
-            with open(test_file, 'w') as f:
-                f.write('test')
-            os.remove(test_file)
+            if not os.access(terraform_dir, os.W_OK):
+                raise PermissionError("directory is not writable")
         except Exception as e:
             result['success'] = False
             result['errors'].append(f"Cannot write to output directory {terraform_dir}: {e}")
@@ -380,17 +450,22 @@ class AutomationPipeline:
         # Backup JSON file
         json_file = self.config['output']['json_file']
         if os.path.exists(json_file):
-            import shutil
             shutil.copy2(json_file, os.path.join(backup_dir, json_file))
         
         # Backup Terraform directory
         terraform_dir = self.config['output']['terraform_dir']
         if os.path.exists(terraform_dir):
-            import shutil
             shutil.copytree(terraform_dir, os.path.join(backup_dir, terraform_dir))
         
         self.logger.info(f"Previous outputs backed up to: {backup_dir}")
     
+    def _values_only(self) -> bool:
+        """True when macro, formula and comment extraction are all disabled."""
+        processing = self.config['processing']
+        return not (processing.get('extract_macros', True)
+                    or processing.get('extract_formulas', True)
+                    or processing.get('extract_comments', True))
+    
     def _extract_excel_data(self, excel_file: str) -> Dict[str, Any]:
         """Extract Excel data to JSON."""
         result = {'success': False, 'errors': [], 'json_file': None}
@@ -400,8 +475,12 @@ class AutomationPipeline:
             base_name = os.path.splitext(os.path.basename(excel_file))[0]
             json_file = f"{base_name}_comprehensive_data.json"
             
-            # Convert Excel to JSON
-            output_file = convert_excel_to_json(excel_file, json_file)
+            # Convert Excel to JSON (streaming read-only sheet pass)
+            output_file = convert_excel_to_json(
+                excel_file, json_file,
+                reader_opts={'read_only': True, 'data_only': True},
+                values_only=self._values_only()
+            )
             
             if output_file and os.path.exists(output_file):
                 result['success'] = True
@@ -415,13 +494,39 @@ class AutomationPipeline:
                 
         except Exception as e:
             result['errors'].append(f"Excel extraction failed: {e}")
-            self.logger.error(f"Excel extraction error: {e}")
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"Excel extraction error: {e}")
         
         return result
     
-    def _create_dynamic_output_directory(self, json_file: str, excel_file: str) -> str:
-        """Create dynamic output directory based on Subscription field and timestamp."""
+    def _extract_excel_data_parallel(self, excel_files: List[str], max_workers: int) -> Dict[str, Dict[str, Any]]:
+        """Extract several Excel files to JSON across a process pool."""
+        results = {}
+        
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(excel_files))) as executor:
+            values_only = self._values_only()
+            futures = [executor.submit(_extract_one, excel_file, values_only) for excel_file in excel_files]
+            total = len(excel_files)
+            for done, future in enumerate(as_completed(futures), 1):
+                excel_file, output_file, error = future.result()
+                result = {'success': False, 'errors': [], 'json_file': None}
+                if output_file:
+                    result['success'] = True
+                    result['json_file'] = output_file
+                    file_size = os.path.getsize(output_file)
+                    self.logger.info(f"[{done}/{total}] JSON file created: {output_file} ({file_size:,} bytes)")
+                else:
+                    result['errors'].append(error)
+                    self.logger.error(f"[{done}/{total}] Excel extraction error for {excel_file}: {error}")
+                results[excel_file] = result
+        
+        return results
+    
+    def _create_dynamic_output_directory(self, json_file: Union[str, Dict[str, Any]], excel_file: str) -> str:
+        """
+        Create dynamic output directory based on Subscription field and timestamp.
+        
+        json_file is the extracted JSON file or its already-parsed data.
+        """
         
         # Check if dynamic folder naming is enabled
         dynamic_naming = self.config.get('output', {}).get('dynamic_folder_naming', True)
@@ -463,11 +568,14 @@ class AutomationPipeline:
         
         return terraform_dir
     
-    def _extract_subscription_from_json(self, json_file: str) -> Optional[str]:
-        """Extract Subscription value from JSON data."""
+    def _extract_subscription_from_json(self, json_file: Union[str, Dict[str, Any]]) -> Optional[str]:
+        """Extract Subscription value from a JSON file or already-parsed JSON data."""
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if isinstance(json_file, dict):
+                data = json_file
+            else:
+                with open(json_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
             
             # Try to find subscription in build environment data
             build_env = data.get('build_environment', {})
@@ -519,19 +627,14 @@ class AutomationPipeline:
     
     def _sanitize_directory_name(self, name: str) -> str:
         """Sanitize name for use as directory name."""
-        import re
-        
         if not name:
             return "unknown"
         
         # Convert to string and clean
         clean_name = str(name).strip()
         
-        # Replace spaces and special characters with underscores
-        clean_name = re.sub(r'[^\w\-_]', '_', clean_name)
-        
-        # Remove multiple consecutive underscores
-        clean_name = re.sub(r'_+', '_', clean_name)
+        # Replace spaces and special characters with a single underscore per run
+        clean_name = _DIR_NAME_UNSAFE_RE.sub('_', clean_name)
         
         # Remove leading/trailing underscores
         clean_name = clean_name.strip('_')
@@ -581,8 +684,7 @@ class AutomationPipeline:
                 
         except Exception as e:
             result['errors'].append(f"Terraform generation failed: {e}")
-            self.logger.error(f"Terraform generation error: {e}")
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"Terraform generation error: {e}")
         
         return result
     
@@ -739,6 +841,10 @@ Exit Codes:
                        help='Validate configuration and inputs without processing')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose logging')
+    parser.add_argument('--jobs', '-J', type=int,
+                       help='Worker processes for multi-file extraction (default: CPU count)')
+    parser.add_argument('--values-only', action='store_true',
+                       help='Extract cell values only (skip macros, formulas and comments)')
     
     args = parser.parse_args()
     
@@ -767,6 +873,11 @@ Exit Codes:
     if args.verbose:
         pipeline.config['logging']['level'] = 'DEBUG'
         pipeline.logger.setLevel(logging.DEBUG)
+    if args.jobs:
+        pipeline.config['processing']['max_workers'] = args.jobs
+    if args.values_only:
+        for key in ('extract_macros', 'extract_formulas', 'extract_comments'):
+            pipeline.config['processing'][key] = False
     
     # Dry run - just validate
     if args.dry_run:
@@ -22,19 +22,34 @@ from datetime import datetime
 import zipfile
 import xml.etree.ElementTree as ET
 
+from excel_io import frame_from_rows, read_sheet_rows
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # optional Rust-backed reader, openpyxl is used otherwise
+    CalamineWorkbook = None
+
+# Formats the calamine reader can take over from openpyxl for cell values
+CALAMINE_EXTENSIONS = ('.xlsx', '.xlsm', '.xlsb', '.xls')
+
 # Suppress openpyxl warnings
 warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
 
 class ComprehensiveExcelExtractor:
     """Extract all possible data from Excel files."""
     
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, reader_opts: Optional[Dict[str, Any]] = None):
         self.file_path = file_path
         self.file_name = os.path.basename(file_path)
         self.extracted_data = {}
         
-    def extract_all(self) -> Dict[str, Any]:
-        """Extract all data from the Excel file."""
+        # openpyxl options for the sheet-data pass (streaming, cached values only)
+        self.reader_opts = {'read_only': True, 'data_only': True}
+        if reader_opts:
+            self.reader_opts.update(reader_opts)
+        
+    def extract_all(self, values_only: bool = False) -> Dict[str, Any]:
+        """Extract all data from the Excel file (only sheet values when values_only)."""
         print(f"Starting comprehensive extraction from: {self.file_path}")
         
         # Initialize extraction result
@@ -60,6 +75,11 @@ class ComprehensiveExcelExtractor:
             # Extract basic sheet data
             self._extract_sheet_data()
             
+            if values_only:
+                # Skip the extra full workbook loads for macros, formulas, etc.
+                print("Values-only mode: skipping macros, formulas, properties, named ranges and comments")
+                return self.extracted_data
+            
             # Extract macros and VBA code
             self._extract_macros()
             
@@ -89,8 +109,7 @@ class ComprehensiveExcelExtractor:
         print("Extracting sheet data...")
         
         try:
-            excel_file = pd.ExcelFile(self.file_path, engine='openpyxl')
-            sheet_names = excel_file.sheet_names
+            sheet_names, read_rows, close = self._open_sheet_reader()
             
             print(f"Found {len(sheet_names)} sheets: {sheet_names}")
             
@@ -109,8 +128,8 @@ class ComprehensiveExcelExtractor:
                 }
                 
                 try:
-                    # Read raw data
-                    df_raw = pd.read_excel(excel_file, sheet_name=sheet_name, header=None, engine='openpyxl')
+                    # Read the sheet once and parse it the way pd.read_excel(header=None) does
+                    df_raw = frame_from_rows(read_sheet_rows(read_rows(sheet_name)))
                     
                     if not df_raw.empty:
                         # Store dimensions
@@ -149,12 +168,42 @@ class ComprehensiveExcelExtractor:
                         'dimensions': {'rows': 0, 'columns': 0}
                     }
             
-            excel_file.close()
+            close()
             
         except Exception as e:
             print(f"Error reading Excel file: {e}")
             self.extracted_data['sheets'] = {'error': str(e)}
     
+    def _open_sheet_reader(self):
+        """
+        Open the workbook for the cell-value pass.
+        
+        Uses python-calamine when it is installed and only cached values are
+        wanted, falling back to openpyxl. Returns (sheet_names, read_rows, close)
+        where read_rows(sheet_name) yields each row as a sequence of values.
+        """
+        use_calamine = (CalamineWorkbook is not None
+                        and self.reader_opts.get('data_only', True)
+                        and self.file_path.lower().endswith(CALAMINE_EXTENSIONS))
+        
+        if use_calamine:
+            workbook = CalamineWorkbook.from_path(self.file_path)
+            
+            def read_rows(sheet_name):
+                # read_sheet_rows normalizes calamine's '' cells and dates
+                return workbook.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False)
+            
+            return workbook.sheet_names, read_rows, getattr(workbook, 'close', lambda: None)
+        
+        from openpyxl import load_workbook
+        
+        workbook = load_workbook(self.file_path, **self.reader_opts)
+        
+        def read_rows(sheet_name):
+            return workbook[sheet_name].iter_rows(values_only=True)
+        
+        return workbook.sheetnames, read_rows, workbook.close
+    
     def _extract_structured_data(self, df: pd.DataFrame, sheet_data: Dict):
         """Extract structured data from DataFrame."""
         # Try different header assumptions
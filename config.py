@@ -6,6 +6,7 @@ Contains all configuration settings for the Excel to JSON conversion process.
 """
 
 import os
+import re
 
 # paths
 EXCEL_INPUT_DIRECTORY = "sourcefiles"  # Directory containing Excel files to process
@@ -19,6 +20,7 @@ INCLUDE_GENERATION_TIMESTAMP = True  # Include generation timestamp in tags
 JSON_INDENT = 2  # JSON indentation level
 JSON_SORT_KEYS = False  # Sort JSON keys alphabetically
 SKIP_EMPTY_VMS = True  # Skip VM entries that don't have hostnames
+PARALLEL_VM_PROCESSING = False  # Convert large VM lists (200+) in worker processes
 
 # azure defaults
 DEFAULT_AZURE_REGION = "East US"
@@ -81,6 +83,10 @@ def get_excel_file_path() -> str:
     
     return None
 
+# compiled once; normalize_resource_name runs for every VM row
+_NAME_INVALID_CHARS_RE = re.compile(r'[^a-z0-9-]')
+_NAME_HYPHEN_RUN_RE = re.compile(r'-{2,}')
+
 def normalize_resource_name(name: str) -> str:
     """
     Normalize a resource name to be compatible with Azure naming conventions.
@@ -100,11 +106,10 @@ def normalize_resource_name(name: str) -> str:
     normalized = normalized.replace('_', '-')
     
     # strip special chars
-    import re
-    normalized = re.sub(r'[^a-z0-9-]', '', normalized)
+    normalized = _NAME_INVALID_CHARS_RE.sub('', normalized)
     
     # remove duplicate hyphens
-    normalized = re.sub(r'-+', '-', normalized)
+    normalized = _NAME_HYPHEN_RUN_RE.sub('-', normalized)
     
     # trim hyphens
     normalized = normalized.strip('-')
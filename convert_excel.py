@@ -9,6 +9,9 @@ import os
 import sys
 from excel_to_json_converter import convert_excel_to_json
 
+# arguments that show the usage text instead of being treated as a file name
+_HELP_FLAGS = frozenset({"-h", "--help", "help"})
+
 def main():
     """Simple command-line interface for Excel to JSON conversion."""
     
@@ -16,7 +19,7 @@ def main():
     print("=" * 50)
     
     # Check command line arguments
-    if len(sys.argv) < 2:
+    if len(sys.argv) < 2 or sys.argv[1].lower() in _HELP_FLAGS:
         print("Usage: python convert_excel.py <excel_file> [output_file]")
         print("\nExamples:")
         print("  python convert_excel.py LLDtest.xlsm")
@@ -9,13 +9,19 @@ import json
 from typing import Dict, Any, List, Optional, Union
 import pandas as pd
 
+from excel_io import _dumps
+
 class ExcelDataAccessor:
     """Easy access to Excel data with column referencing capabilities."""
     
-    def __init__(self, json_file_path: str):
-        """Initialize with JSON file from comprehensive extraction."""
-        self.json_file_path = json_file_path
-        self.data = self._load_data()
+    def __init__(self, json_file_path: Union[str, Dict[str, Any]]):
+        """Initialize with JSON file (or already-parsed data) from comprehensive extraction."""
+        if isinstance(json_file_path, dict):
+            self.json_file_path = None
+            self.data = json_file_path
+        else:
+            self.json_file_path = json_file_path
+            self.data = self._load_data()
         self.sheets = self.data.get('sheets', {})
         
     def _load_data(self) -> Dict[str, Any]:
@@ -647,8 +653,8 @@ class ExcelDataAccessor:
         """Export data in Terraform-ready format."""
         terraform_data = self.get_terraform_ready_data()
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(terraform_data, f, indent=2, default=str, ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            f.write(_dumps(terraform_data))
         
         return output_file
     
@@ -7,15 +7,15 @@ Generates proper Terraform files from Excel data with column referencing and str
 
 import json
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 from data_accessor import ExcelDataAccessor
 
 class EnhancedTerraformGenerator:
     """Generate Terraform files from Excel data with proper structure and formatting."""
     
-    def __init__(self, json_file_path: str):
-        """Initialize with JSON file from comprehensive extraction."""
+    def __init__(self, json_file_path: Union[str, Dict[str, Any]]):
+        """Initialize with JSON file (or already-parsed data) from comprehensive extraction."""
         self.accessor = ExcelDataAccessor(json_file_path)
         self.terraform_data = self.accessor.get_terraform_ready_data()
         
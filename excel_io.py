@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Shared Excel/JSON I/O Helpers
+=============================
+Small helpers used by both the read_build_data script and the extractors:
+turning workbook cell rows into the DataFrame pd.read_excel would build, and
+writing indented JSON with orjson when it is installed.
+
+Kept free of heavy optional imports (numba, openpyxl, calamine) so importing
+an extractor stays cheap.
+"""
+
+import json
+from datetime import date, datetime
+from typing import Any, Callable, List, Optional
+
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON encoder
+    orjson = None
+
+# Cell error codes pandas' openpyxl reader turns into NaN
+EXCEL_ERROR_VALUES = frozenset({'#NULL!', '#DIV/0!', '#VALUE!', '#REF!', '#NAME?', '#NUM!', '#N/A'})
+
+def read_sheet_rows(sheet_rows) -> List[List[Any]]:
+    """
+    Normalize a sheet's cell-value rows into a list of equal-width rows.
+
+    Matches what pandas' openpyxl reader hands to its parser: empty cells are
+    '', errors NaN, integral floats int, dates datetimes, trailing empty cells
+    and rows are dropped and rows are padded to the same width.
+    """
+    rows = []
+    width = 0
+    last_data_row = 0
+
+    for values in sheet_rows:
+        row = []
+        for value in values:
+            if value is None:
+                value = ''
+            elif type(value) is float and value.is_integer():
+                value = int(value)
+            elif type(value) is date:
+                value = datetime(value.year, value.month, value.day)  # calamine gives dates
+            elif type(value) is str and value in EXCEL_ERROR_VALUES:
+                value = float('nan')
+            row.append(value)
+
+        # Trim trailing empty cells
+        while row and row[-1] == '':
+            row.pop()
+
+        rows.append(row)
+        if row:
+            width = max(width, len(row))
+            last_data_row = len(rows)
+
+    return [row + [''] * (width - len(row)) for row in rows[:last_data_row]]
+
+def frame_from_rows(rows: List[List[Any]], header: Optional[int] = None) -> pd.DataFrame:
+    """Build a DataFrame from sheet rows the same way pd.read_excel(header=...) does."""
+    if not rows:
+        return pd.DataFrame()
+    # object columns skip pandas' per-column numeric/date inference; cell values
+    # are already typed by the reader. NA filtering stays on for '' cells.
+    return TextParser(rows, header=header, dtype=object).read()
+
+def _dumps(obj: Any, default: Callable[[Any], Any] = str, sort_keys: bool = False) -> bytes:
+    """
+    Serialize a value to indented UTF-8 JSON bytes, using orjson when available.
+
+    Non-str keys (raw_data rows are keyed by column index) and numpy values are
+    allowed; datetimes and anything else unsupported go through default, so
+    both encoders write the same text.
+    """
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                  | orjson.OPT_PASSTHROUGH_DATETIME)
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option, default=default)
+    return json.dumps(obj, indent=2, default=default, sort_keys=sort_keys, ensure_ascii=False).encode('utf-8')
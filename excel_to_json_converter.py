@@ -20,61 +20,129 @@ import sys
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
-# Import our custom extractors
-from comprehensive_excel_extractor import ComprehensiveExcelExtractor
-from vba_macro_extractor import VBAMacroExtractor
+from excel_io import _dumps as _dumps_json
+
+CONVERTER_VERSION = "1.0.0"
+
+# sidecar written next to the output JSON with the conversion's source fingerprint
+FINGERPRINT_SUFFIX = ".fingerprint"
+
+
+def _json_default(obj: Any) -> str:
+    """Last-resort encoder for values orjson cannot serialize natively."""
+    if isinstance(obj, (bytes, bytearray)):
+        return obj.hex()
+    return str(obj)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a value to indented UTF-8 JSON bytes, hex-encoding raw bytes."""
+    return _dumps_json(obj, default=_json_default)
+
+
+def _write_streamed(f, data: Dict[str, Any]):
+    """
+    Write a top-level dict as indented JSON, serializing sheets one at a time.
+    
+    Only one sheet's encoded bytes are held at once instead of the whole document.
+    Nested chunks are re-indented by padding their newlines, which is safe because
+    JSON strings never contain raw newlines.
+    """
+    f.write(b'{')
+    for i, (key, value) in enumerate(data.items()):
+        f.write(b',\n  ' if i else b'\n  ')
+        f.write(_dumps(key) + b': ')
+        if key == 'sheets' and isinstance(value, dict) and value:
+            f.write(b'{')
+            for j, (sheet_name, sheet_data) in enumerate(value.items()):
+                f.write(b',\n    ' if j else b'\n    ')
+                f.write(_dumps(str(sheet_name)) + b': ' + _dumps(sheet_data).replace(b'\n', b'\n    '))
+            f.write(b'\n  }')
+        else:
+            f.write(_dumps(value).replace(b'\n', b'\n  '))
+    f.write(b'\n}' if data else b'}')
 
 class ExcelToJSONConverter:
     """Complete Excel to JSON converter."""
     
-    def __init__(self, excel_file_path: str):
+    def __init__(self, excel_file_path: str, verbose: bool = True,
+                 reader_opts: Optional[Dict[str, Any]] = None, values_only: bool = False):
         self.excel_file_path = excel_file_path
+        self.verbose = verbose
+        self.values_only = values_only
         self.file_name = os.path.basename(excel_file_path)
         self.base_name = os.path.splitext(self.file_name)[0]
         
-        # Initialize extractors
-        self.comprehensive_extractor = ComprehensiveExcelExtractor(excel_file_path)
+        # Initialize extractors (imported here so the CLI usage path skips pandas/openpyxl)
+        from comprehensive_excel_extractor import ComprehensiveExcelExtractor
+        from vba_macro_extractor import VBAMacroExtractor
+        
+        self.comprehensive_extractor = ComprehensiveExcelExtractor(excel_file_path, reader_opts=reader_opts)
         self.vba_extractor = VBAMacroExtractor(excel_file_path)
         
         # Final combined data
         self.final_json_data = {}
         
+        # Processing summary memo: (id of comprehensive data, summary dict)
+        self._summary_cache = None
+        
+    def _emit(self, lines: List[str]):
+        """Write a block of progress lines in one call (silent when not verbose)."""
+        if self.verbose:
+            sys.stdout.write('\n'.join(lines) + '\n')
+    
     def convert_to_json(self, output_file: str = None) -> str:
         """Convert Excel file to comprehensive JSON format."""
-        print("=" * 80)
-        print("EXCEL TO JSON CONVERTER")
-        print("=" * 80)
-        print(f"Converting: {self.file_name}")
-        print()
+        self._emit([
+            "=" * 80,
+            "EXCEL TO JSON CONVERTER",
+            "=" * 80,
+            f"Converting: {self.file_name}",
+            ""
+        ])
+        
+        # one timestamp per conversion keeps the metadata and summary consistent
+        self._conv_ts = datetime.now().isoformat()
         
         if not os.path.exists(self.excel_file_path):
             print(f"Error: File not found: {self.excel_file_path}")
             return None
         
+        if output_file is None:
+            output_file = f"{self.base_name}_complete_conversion.json"
+        
+        # Skip the whole conversion if this exact source was already exported here
+        if self._output_is_current(output_file):
+            self._emit([f"Output is up to date for {self.file_name}, skipping extraction: {output_file}"])
+            return output_file
+        
         try:
             # Step 1: Extract comprehensive Excel data
-            print("Step 1: Extracting comprehensive Excel data...")
-            comprehensive_data = self.comprehensive_extractor.extract_all()
+            self._emit(["Step 1: Extracting comprehensive Excel data..."])
+            comprehensive_data = self.comprehensive_extractor.extract_all(values_only=self.values_only)
             
             # Step 2: Extract VBA macros
-            print("\nStep 2: Extracting VBA macros...")
-            vba_data = self.vba_extractor.extract_vba_code()
+            if self.values_only:
+                self._emit(["\nStep 2: Skipping VBA macros (values only)"])
+                vba_data = {}
+            else:
+                self._emit(["\nStep 2: Extracting VBA macros..."])
+                vba_data = self.vba_extractor.extract_vba_code()
             
             # Step 3: Combine all data
-            print("\nStep 3: Combining all extracted data...")
+            self._emit(["\nStep 3: Combining all extracted data..."])
             self.final_json_data = self._combine_extracted_data(comprehensive_data, vba_data)
             
             # Step 4: Export to JSON
-            if output_file is None:
-                output_file = f"{self.base_name}_complete_conversion.json"
-            
-            print(f"\nStep 4: Exporting to JSON file: {output_file}")
+            self._emit([f"\nStep 4: Exporting to JSON file: {output_file}"])
             success = self._export_to_json(output_file)
             
             if success:
-                print("\n" + "=" * 80)
-                print("CONVERSION COMPLETED SUCCESSFULLY!")
-                print("=" * 80)
+                self._emit([
+                    "\n" + "=" * 80,
+                    "CONVERSION COMPLETED SUCCESSFULLY!",
+                    "=" * 80
+                ])
                 
                 # Show summary
                 self._show_conversion_summary(output_file)
@@ -96,9 +164,11 @@ class ExcelToJSONConverter:
             # File and extraction metadata
             "conversion_metadata": {
                 "source_file": self.excel_file_path,
-                "conversion_timestamp": datetime.now().isoformat(),
-                "converter_version": "1.0.0",
-                "extraction_methods": ["comprehensive_excel_extractor", "vba_macro_extractor"]
+                "conversion_timestamp": self._conv_ts,
+                "converter_version": CONVERTER_VERSION,
+                "extraction_methods": (["comprehensive_excel_extractor"] if self.values_only
+                                       else ["comprehensive_excel_extractor", "vba_macro_extractor"]),
+                "values_only": self.values_only
             },
             
             # File information
@@ -144,14 +214,19 @@ class ExcelToJSONConverter:
     def _generate_processing_summary(self, comprehensive_data: Dict, vba_data: Dict) -> Dict[str, Any]:
         """Generate a summary of the processing results."""
         
+        if self._summary_cache is not None and self._summary_cache[0] == id(comprehensive_data):
+            return self._summary_cache[1]
+        
         sheets = comprehensive_data.get('sheets', {})
         formulas = comprehensive_data.get('formulas', {})
         
         # Count total data points
-        total_tables = sum(len(sheet.get('tables', [])) for sheet in sheets.values())
-        total_key_value_pairs = sum(len(sheet.get('key_value_pairs', {})) for sheet in sheets.values())
-        total_formulas = sum(len(sheet_formulas) for sheet_formulas in formulas.values() 
-                           if isinstance(sheet_formulas, list))
+        total_tables = sum(map(len, (sheet.get('tables', ()) for sheet in sheets.values())))
+        total_key_value_pairs = sum(map(len, (sheet.get('key_value_pairs', {}) for sheet in sheets.values())))
+        # values come from deserialized JSON, so an exact type check is enough
+        total_formulas = sum(map(len, (v for v in formulas.values() if type(v) is list)))
+        comments = comprehensive_data.get('comments', {})
+        comments_count = sum(map(len, (v for v in comments.values() if type(v) is list)))
         
         # Count VBA elements
         vba_project = vba_data.get('vba_project', {})
@@ -165,18 +240,44 @@ class ExcelToJSONConverter:
             "has_vba_macros": has_macros,
             "vba_project_size_bytes": vba_project.get('size_bytes', 0),
             "named_ranges_count": len(comprehensive_data.get('named_ranges', {})),
-            "comments_count": sum(len(sheet_comments) for sheet_comments in comprehensive_data.get('comments', {}).values() 
-                                if isinstance(sheet_comments, list)),
-            "extraction_timestamp": datetime.now().isoformat()
+            "comments_count": comments_count,
+            "extraction_timestamp": self._conv_ts
         }
         
+        self._summary_cache = (id(comprehensive_data), summary)
         return summary
     
+    def _source_fingerprint(self) -> str:
+        """
+        Cheap fingerprint of a conversion: converter version, mode, reader
+        options and the source workbook's resolved path, mtime and size.
+        """
+        stat = os.stat(self.excel_file_path)
+        mode = 'values' if self.values_only else 'full'
+        reader_opts = json.dumps(self.comprehensive_extractor.reader_opts, sort_keys=True, default=str)
+        source = os.path.realpath(self.excel_file_path)
+        return f"{CONVERTER_VERSION}:{mode}:{reader_opts}:{source}:{stat.st_mtime_ns}:{stat.st_size}"
+    
+    def _output_is_current(self, output_file: str) -> bool:
+        """True if output_file was written from this exact source and options."""
+        sidecar_file = f"{output_file}{FINGERPRINT_SUFFIX}"
+        if not (os.path.exists(output_file) and os.path.exists(sidecar_file)):
+            return False
+        try:
+            with open(sidecar_file, 'r', encoding='utf-8') as f:
+                return f.read().strip() == self._source_fingerprint()
+        except OSError:
+            return False
+    
     def _export_to_json(self, output_file: str) -> bool:
         """Export final data to JSON file."""
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(self.final_json_data, f, indent=2, default=str, ensure_ascii=False)
+            with open(output_file, 'wb') as f:
+                _write_streamed(f, self.final_json_data)
+            
+            # Record what was converted so an unchanged rerun can skip extraction
+            with open(f"{output_file}{FINGERPRINT_SUFFIX}", 'w', encoding='utf-8') as f:
+                f.write(self._source_fingerprint())
             
             return True
             
@@ -186,52 +287,66 @@ class ExcelToJSONConverter:
     
     def _show_conversion_summary(self, output_file: str):
         """Show summary of the conversion process."""
+        if not self.verbose:
+            return
         
         file_size = os.path.getsize(output_file)
         summary = self.final_json_data.get('processing_summary', {})
         
-        print(f"Source file: {self.file_name}")
-        print(f"Output file: {output_file}")
-        print(f"Output size: {file_size:,} bytes")
-        print()
-        print("Data extracted:")
-        print(f"  • Sheets processed: {summary.get('sheets_processed', 0)}")
-        print(f"  • Tables extracted: {summary.get('total_tables_extracted', 0)}")
-        print(f"  • Key-value pairs: {summary.get('total_key_value_pairs', 0)}")
-        print(f"  • Formulas found: {summary.get('total_formulas_found', 0)}")
-        print(f"  • VBA macros: {'Yes' if summary.get('has_vba_macros') else 'No'}")
-        print(f"  • Named ranges: {summary.get('named_ranges_count', 0)}")
-        print(f"  • Comments: {summary.get('comments_count', 0)}")
+        lines = [
+            f"Source file: {self.file_name}",
+            f"Output file: {output_file}",
+            f"Output size: {file_size:,} bytes",
+            "",
+            "Data extracted:",
+            f"  • Sheets processed: {summary.get('sheets_processed', 0)}",
+            f"  • Tables extracted: {summary.get('total_tables_extracted', 0)}",
+            f"  • Key-value pairs: {summary.get('total_key_value_pairs', 0)}",
+            f"  • Formulas found: {summary.get('total_formulas_found', 0)}",
+            f"  • VBA macros: {'Yes' if summary.get('has_vba_macros') else 'No'}",
+            f"  • Named ranges: {summary.get('named_ranges_count', 0)}",
+            f"  • Comments: {summary.get('comments_count', 0)}"
+        ]
         
         if summary.get('has_vba_macros'):
-            print(f"  • VBA project size: {summary.get('vba_project_size_bytes', 0):,} bytes")
+            lines.append(f"  • VBA project size: {summary.get('vba_project_size_bytes', 0):,} bytes")
         
-        print()
-        print("The JSON file contains ALL data from your Excel file including:")
-        print("  • Raw cell data from all sheets")
-        print("  • Structured tables and key-value pairs")
-        print("  • VBA macro information and detected code patterns")
-        print("  • Formulas and calculated values")
-        print("  • Workbook properties and metadata")
-        print("  • Named ranges and data validation rules")
-        print("  • Comments and formatting information")
-        print("=" * 80)
+        lines += [
+            "",
+            "The JSON file contains ALL data from your Excel file including:",
+            "  • Raw cell data from all sheets",
+            "  • Structured tables and key-value pairs",
+            "  • VBA macro information and detected code patterns",
+            "  • Formulas and calculated values",
+            "  • Workbook properties and metadata",
+            "  • Named ranges and data validation rules",
+            "  • Comments and formatting information",
+            "=" * 80
+        ]
+        self._emit(lines)
     
     def get_conversion_summary(self) -> Dict[str, Any]:
         """Get summary of the conversion without doing the full conversion."""
+        if self._summary_cache is not None:
+            return self._summary_cache[1]
         return self.final_json_data.get('processing_summary', {})
 
 
-def convert_excel_to_json(excel_file_path: str, output_file: str = None) -> str:
+def convert_excel_to_json(excel_file_path: str, output_file: str = None, verbose: bool = True,
+                          reader_opts: Optional[Dict[str, Any]] = None, values_only: bool = False) -> str:
     """Convenience function to convert Excel file to JSON."""
-    converter = ExcelToJSONConverter(excel_file_path)
+    converter = ExcelToJSONConverter(excel_file_path, verbose=verbose, reader_opts=reader_opts,
+                                     values_only=values_only)
     return converter.convert_to_json(output_file)
 
 
+# arguments that show the usage text instead of being treated as a file name
+_HELP_FLAGS = frozenset({"-h", "--help", "help"})
+
 def main():
     """Main function for command-line usage."""
     
-    if len(sys.argv) < 2:
+    if len(sys.argv) < 2 or sys.argv[1].lower() in _HELP_FLAGS:
         print("Usage: python excel_to_json_converter.py <excel_file> [output_file]")
         print("\nExamples:")
         print("  python excel_to_json_converter.py LLDtest.xlsm")
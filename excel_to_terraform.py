@@ -19,23 +19,33 @@ from enhanced_terraform_generator import EnhancedTerraformGenerator
 class ExcelToTerraformConverter:
     """Complete Excel to Terraform conversion pipeline."""
     
-    def __init__(self, excel_file_path: str):
+    def __init__(self, excel_file_path: str, verbose: bool = True):
         self.excel_file_path = excel_file_path
+        self.verbose = verbose
         self.base_name = os.path.splitext(os.path.basename(excel_file_path))[0]
         self.json_file_path = f"{self.base_name}_comprehensive.json"
         self.terraform_output_dir = f"{self.base_name}_terraform"
+        # accessor over the comprehensive JSON, shared by convert() and the helpers
+        self.accessor = None
         
+    def _emit(self, lines: List[str]):
+        """Write a block of progress lines in one call (silent when not verbose)."""
+        if self.verbose:
+            sys.stdout.write('\n'.join(lines) + '\n')
+    
     def convert(self, output_dir: str = None) -> Dict[str, Any]:
         """Complete conversion pipeline from Excel to Terraform."""
         
         if output_dir:
             self.terraform_output_dir = output_dir
         
-        print("=" * 80)
-        print("EXCEL TO TERRAFORM CONVERTER")
-        print("=" * 80)
-        print(f"Converting: {self.excel_file_path}")
-        print()
+        self._emit([
+            "=" * 80,
+            "EXCEL TO TERRAFORM CONVERTER",
+            "=" * 80,
+            f"Converting: {self.excel_file_path}",
+            ""
+        ])
         
         results = {
             'excel_file': self.excel_file_path,
@@ -47,58 +57,70 @@ class ExcelToTerraformConverter:
         
         try:
             # Step 1: Convert Excel to comprehensive JSON
-            print("Step 1: Converting Excel to comprehensive JSON...")
-            json_result = convert_excel_to_json(self.excel_file_path, self.json_file_path)
+            self._emit(["Step 1: Converting Excel to comprehensive JSON..."])
+            json_result = convert_excel_to_json(self.excel_file_path, self.json_file_path, verbose=self.verbose)
             
             if not json_result:
                 results['errors'].append("Failed to convert Excel to JSON")
                 return results
             
             results['json_file'] = json_result
-            print(f"SUCCESS: JSON conversion completed: {json_result}")
+            self._emit([f"SUCCESS: JSON conversion completed: {json_result}"])
+            
+            # Parse the JSON once; the generator wraps it in the data accessor that
+            # step 2 and the helper methods reuse
+            with open(json_result, 'r', encoding='utf-8') as f:
+                json_data = json.load(f)
+            
+            generator = EnhancedTerraformGenerator(json_data)
+            self.accessor = generator.accessor
             
             # Step 2: Create data accessor
-            print("\nStep 2: Creating data accessor...")
-            accessor = ExcelDataAccessor(json_result)
-            summary = accessor.get_summary()
-            print(f"SUCCESS: Data accessor created - {summary['total_sheets']} sheets, {summary['total_tables']} tables")
+            summary = self.accessor.get_summary()
+            self._emit([
+                "\nStep 2: Creating data accessor...",
+                f"SUCCESS: Data accessor created - {summary['total_sheets']} sheets, {summary['total_tables']} tables"
+            ])
             
-            # Step 3: Generate Terraform files
-            print(f"\nStep 3: Generating Terraform files in '{self.terraform_output_dir}'...")
-            generator = EnhancedTerraformGenerator(json_result)
+            # Step 3: Generate Terraform files (file writes stay on the main thread)
+            self._emit([f"\nStep 3: Generating Terraform files in '{self.terraform_output_dir}'..."])
             terraform_files = generator.generate_terraform_files(self.terraform_output_dir)
             
             results['terraform_files'] = terraform_files
-            print(f"SUCCESS: Terraform files generated: {len(terraform_files)} files")
             
             # Step 4: Generate summary
             terraform_summary = generator.generate_summary()
-            print(f"\nStep 4: Terraform generation summary:")
-            print(f"  Project: {terraform_summary['project_name']}")
-            print(f"  Application: {terraform_summary['application_name']}")
-            print(f"  VMs: {terraform_summary['resources']['virtual_machines']}")
-            print(f"  Security Rules: {terraform_summary['resources']['network_security_rules']}")
             
             results['success'] = True
             results['terraform_summary'] = terraform_summary
             
-            print("\n" + "=" * 80)
-            print("CONVERSION COMPLETED SUCCESSFULLY!")
-            print("=" * 80)
-            print(f"Excel file: {self.excel_file_path}")
-            print(f"JSON file: {json_result}")
-            print(f"Terraform directory: {self.terraform_output_dir}")
-            print()
-            print("Generated Terraform files:")
-            for filename, filepath in terraform_files.items():
-                print(f"  {filename}")
-            print()
-            print("Next steps:")
-            print(f"  1. cd {self.terraform_output_dir}")
-            print("  2. terraform init")
-            print("  3. terraform plan")
-            print("  4. terraform apply")
-            print("=" * 80)
+            lines = [
+                f"SUCCESS: Terraform files generated: {len(terraform_files)} files",
+                f"\nStep 4: Terraform generation summary:",
+                f"  Project: {terraform_summary['project_name']}",
+                f"  Application: {terraform_summary['application_name']}",
+                f"  VMs: {terraform_summary['resources']['virtual_machines']}",
+                f"  Security Rules: {terraform_summary['resources']['network_security_rules']}",
+                "\n" + "=" * 80,
+                "CONVERSION COMPLETED SUCCESSFULLY!",
+                "=" * 80,
+                f"Excel file: {self.excel_file_path}",
+                f"JSON file: {json_result}",
+                f"Terraform directory: {self.terraform_output_dir}",
+                "",
+                "Generated Terraform files:"
+            ]
+            lines.extend(f"  {filename}" for filename in terraform_files)
+            lines += [
+                "",
+                "Next steps:",
+                f"  1. cd {self.terraform_output_dir}",
+                "  2. terraform init",
+                "  3. terraform plan",
+                "  4. terraform apply",
+                "=" * 80
+            ]
+            self._emit(lines)
             
         except Exception as e:
             error_msg = f"Conversion failed: {e}"
@@ -109,13 +131,21 @@ class ExcelToTerraformConverter:
         
         return results
     
+    def _get_accessor(self) -> Optional[ExcelDataAccessor]:
+        """Return the shared accessor, loading the JSON file once if convert() has not run."""
+        if self.accessor is None:
+            if not os.path.exists(self.json_file_path):
+                print(f"JSON file not found: {self.json_file_path}")
+                return None
+            self.accessor = ExcelDataAccessor(self.json_file_path)
+        return self.accessor
+    
     def get_column_data(self, sheet_name: str, column_keywords: List[str], table_index: int = 0) -> List[Any]:
         """Get data from a specific column using keywords."""
-        if not os.path.exists(self.json_file_path):
-            print(f"JSON file not found: {self.json_file_path}")
+        accessor = self._get_accessor()
+        if accessor is None:
             return []
         
-        accessor = ExcelDataAccessor(self.json_file_path)
         column_name = accessor.get_column_by_keywords(sheet_name, column_keywords, table_index)
         
         if column_name:
@@ -126,39 +156,39 @@ class ExcelToTerraformConverter:
     
     def get_key_value(self, sheet_name: str, key_keywords: List[str]) -> Optional[str]:
         """Get a value by finding key with keywords."""
-        if not os.path.exists(self.json_file_path):
-            print(f"JSON file not found: {self.json_file_path}")
+        accessor = self._get_accessor()
+        if accessor is None:
             return None
         
-        accessor = ExcelDataAccessor(self.json_file_path)
         return accessor.get_value_by_keywords(sheet_name, key_keywords)
     
     def search_data(self, search_term: str, case_sensitive: bool = False) -> Dict[str, List[Dict[str, Any]]]:
         """Search for data across all sheets."""
-        if not os.path.exists(self.json_file_path):
-            print(f"JSON file not found: {self.json_file_path}")
+        accessor = self._get_accessor()
+        if accessor is None:
             return {}
         
-        accessor = ExcelDataAccessor(self.json_file_path)
         return accessor.search_across_sheets(search_term, case_sensitive)
     
     def export_terraform_data(self, output_file: str = None) -> str:
         """Export data in Terraform-ready format."""
-        if not os.path.exists(self.json_file_path):
-            print(f"JSON file not found: {self.json_file_path}")
+        accessor = self._get_accessor()
+        if accessor is None:
             return None
         
-        accessor = ExcelDataAccessor(self.json_file_path)
         if output_file is None:
             output_file = f"{self.base_name}_terraform_data.json"
         
         return accessor.export_terraform_data(output_file)
 
 
+# arguments that show the usage text instead of being treated as a file name
+_HELP_FLAGS = frozenset({"-h", "--help", "help"})
+
 def main():
     """Main function for command-line usage."""
     
-    if len(sys.argv) < 2:
+    if len(sys.argv) < 2 or sys.argv[1].lower() in _HELP_FLAGS:
         print("Excel to Terraform Converter")
         print("=" * 50)
         print("Usage: python excel_to_terraform.py <excel_file> [output_dir]")
@@ -9,9 +9,56 @@ Kicks off the complete automation pipeline with all features.
 import sys
 import os
 import argparse
+import logging
 from datetime import datetime
 from automation_pipeline import AutomationPipeline
 
+_log = logging.getLogger("main")
+
+_BAR = "=" * 80
+_HEADER = f"{_BAR}\nExcel to Terraform Automation Pipeline\n{_BAR}"
+
+
+class _DeferredFlushHandler(logging.StreamHandler):
+    """Stream handler that leaves flushing to explicit section boundaries."""
+    
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+def _configure_console_logging(verbose: bool = False):
+    """Route console output through a 64 KB buffered stdout stream."""
+    try:
+        stream = open(sys.stdout.fileno(), 'w', buffering=65536, closefd=False,
+                      encoding=sys.stdout.encoding or 'utf-8')
+    except (AttributeError, OSError, ValueError):
+        # stdout without a real file descriptor (e.g. captured by a test runner)
+        stream = sys.stdout
+    
+    handler = _DeferredFlushHandler(stream)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    _log.handlers.clear()
+    _log.addHandler(handler)
+    _log.propagate = False
+    _log.setLevel(logging.DEBUG if verbose else logging.INFO)
+
+
+# command line option -> (config section, config key) it overrides
+_CONFIG_OVERRIDES = {
+    'output_dir': ('output', 'terraform_dir'),
+    'jobs': ('processing', 'max_workers'),
+}
+
+
+def _flush_log():
+    """Flush buffered console output at a section boundary."""
+    for handler in _log.handlers:
+        handler.flush()
+
+
 def main():
     """Main entry point - kicks off automation pipeline."""
     
@@ -37,6 +84,12 @@ Examples:
   
   # Verbose output
   python main.py --verbose
+  
+  # Limit parallel extraction to 4 worker processes
+  python main.py --jobs 4
+  
+  # Skip macro/formula extraction (Terraform only needs cell values)
+  python main.py --values-only
 
 Features:
   - Automatic Excel file discovery in sourcefiles directory
@@ -50,10 +103,12 @@ Features:
     
     parser.add_argument('--config', '-c', 
                        help='Configuration file (default: automation_config.json)')
-    parser.add_argument('--excel-file', '-e',
-                       help='Excel file to process (single file mode)')
-    parser.add_argument('--input-dir', '-d',
-                       help='Directory containing Excel files')
+    # single-file and directory modes are exclusive; argparse rejects both at once
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--excel-file', '-e',
+                     help='Excel file to process (single file mode)')
+    mode.add_argument('--input-dir', '-d',
+                     help='Directory containing Excel files')
     parser.add_argument('--output-dir', '-o',
                        help='Terraform output directory')
     parser.add_argument('--dry-run', action='store_true',
@@ -62,77 +117,90 @@ Features:
                        help='Enable verbose logging')
     parser.add_argument('--no-backup', action='store_true',
                        help='Skip backup of previous outputs')
+    parser.add_argument('--jobs', '-j', type=int,
+                       help='Worker processes for multi-file extraction (default: CPU count)')
+    parser.add_argument('--values-only', action='store_true',
+                       help='Extract cell values only (skip macros, formulas and comments)')
     
     args = parser.parse_args()
+    _configure_console_logging(args.verbose)
     
     # show header
-    print("=" * 80)
-    print("Excel to Terraform Automation Pipeline")
-    print("=" * 80)
-    print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    _log.info(_HEADER)
+    _log.info(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # init pipeline
+    # init pipeline (flush first; config load warnings are printed directly)
     config_file = args.config or 'automation_config.json'
+    _flush_log()
     pipeline = AutomationPipeline(config_file)
     
     # apply command line overrides
     if args.excel_file:
         pipeline.config['input']['process_multiple_files'] = False
         pipeline.config['input']['excel_file'] = args.excel_file
-        print(f"Mode: Single file - {args.excel_file}")
+        _log.info(f"Mode: Single file - {args.excel_file}")
     elif args.input_dir:
         pipeline.config['input']['process_multiple_files'] = True
         pipeline.config['input']['input_directory'] = args.input_dir
-        print(f"Mode: Multi-file - {args.input_dir}")
+        _log.info(f"Mode: Multi-file - {args.input_dir}")
     else:
-        print(f"Mode: Multi-file - sourcefiles directory")
+        _log.info(f"Mode: Multi-file - sourcefiles directory")
     
-    if args.output_dir:
-        pipeline.config['output']['terraform_dir'] = args.output_dir
+    for option, (section, key) in _CONFIG_OVERRIDES.items():
+        value = getattr(args, option)
+        if value:
+            pipeline.config[section][key] = value
     
     if args.no_backup:
         pipeline.config['output']['backup_previous'] = False
     
+    if args.values_only:
+        for key in ('extract_macros', 'extract_formulas', 'extract_comments'):
+            pipeline.config['processing'][key] = False
+        _log.info("Extraction: Cell values only")
+    
     if args.verbose:
-        import logging
         pipeline.config['logging']['level'] = 'DEBUG'
         pipeline.logger.setLevel(logging.DEBUG)
-        print("Logging: Verbose mode enabled")
+        _log.info("Logging: Verbose mode enabled")
     
-    print("=" * 80)
+    _log.info(_BAR)
     
     # dry run mode
     if args.dry_run:
-        print("\nDry run mode - validating inputs...\n")
+        _log.info("\nDry run mode - validating inputs...\n")
+        # flush so our header precedes the pipeline's validation log lines
+        _flush_log()
         validation_result = pipeline._validate_inputs()
         if validation_result['success']:
-            print("SUCCESS: Validation passed - ready to process")
+            _log.info("SUCCESS: Validation passed - ready to process")
             return 0
         else:
-            print("ERROR: Validation failed:")
+            _log.info("ERROR: Validation failed:")
             for error in validation_result['errors']:
-                print(f"  - {error}")
+                _log.info(f"  - {error}")
             return 1
     
-    # run the pipeline
+    # run the pipeline (flush first so our header precedes pipeline output)
+    _flush_log()
     results = pipeline.run()
     
     # show results
-    print("\n" + "=" * 80)
+    _log.info(f"\n{_BAR}")
     if results['success']:
-        print("SUCCESS: Automation completed")
-        print(f"Duration: {results['duration_seconds']:.2f} seconds")
-        print(f"Files generated: {len(results['files_generated'])}")
-        print("=" * 80)
+        _log.info("SUCCESS: Automation completed")
+        _log.info(f"Duration: {results['duration_seconds']:.2f} seconds")
+        _log.info(f"Files generated: {len(results['files_generated'])}")
+        _log.info(_BAR)
         return 0
     else:
-        print("ERROR: Automation failed")
-        print(f"Duration: {results['duration_seconds']:.2f} seconds")
+        _log.info("ERROR: Automation failed")
+        _log.info(f"Duration: {results['duration_seconds']:.2f} seconds")
         if results['errors']:
-            print("Errors:")
+            _log.info("Errors:")
             for error in results['errors']:
-                print(f"  - {error}")
-        print("=" * 80)
+                _log.info(f"  - {error}")
+        _log.info(_BAR)
         return 2
 
 
@@ -1,8 +1,42 @@
 import pandas as pd
+import numpy as np
 import os
 from typing import Dict, Any, Optional, List
-import json
+import logging
+import re
+import sys
 import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
+from openpyxl import load_workbook
+
+from excel_io import _dumps, frame_from_rows, read_sheet_rows
+
+try:
+    from numba import njit
+except ImportError:  # optional JIT for the table scan
+    njit = None
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # optional Rust-backed reader, openpyxl is used otherwise
+    CalamineWorkbook = None
+
+logger = logging.getLogger(__name__)
+
+# Cell text treated as no value by the key/value scan
+EMPTY_TEXT_VALUES = ('nan', 'none', '')
+
+# Table headers that mark a table as VM data (hostname-like columns)
+VM_HEADER_RE = re.compile(r'host|vm|server|machine|instance', re.IGNORECASE)
+
+# Sheets with fewer non-empty cells only get the key/value scan
+SPARSE_SHEET_CELLS = 20
+
+# How far below a header row table detection looks for data rows
+TABLE_SCAN_ROWS = 50
+
+# Upper bound on threads parsing sheets concurrently
+MAX_SHEET_WORKERS = 8
 
 def read_all_sheets_comprehensive(file_path: str) -> Dict[str, Any]:
     """
@@ -14,56 +48,95 @@ def read_all_sheets_comprehensive(file_path: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing data from all sheets
     """
-    print(f"Reading all sheets from '{file_path}'...")
+    logger.info(f"Reading all sheets from '{file_path}'...")
     
     if not os.path.exists(file_path):
-        print(f"Error: Excel file not found: {file_path}")
+        logger.error(f"Excel file not found: {file_path}")
         return {}
     
     all_data = {}
     
     try:
-        # Suppress openpyxl warnings about extension styles
-        warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
-        
-        # Read the Excel file and get all sheet names
-        excel_file = pd.ExcelFile(file_path, engine='openpyxl')
-        sheet_names = excel_file.sheet_names
-        
-        print(f"Found {len(sheet_names)} sheets: {sheet_names}")
-        
-        for sheet_name in sheet_names:
-            print(f"\nProcessing sheet: '{sheet_name}'")
+        # Suppress openpyxl warnings about extension styles (for this read only)
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
             
+            # Open the workbook once in streaming mode, cached values only
+            sheet_names, read_rows, close = open_sheet_reader(file_path)
             try:
-                # Read the sheet with different strategies
-                sheet_data = read_sheet_comprehensive(excel_file, sheet_name, file_path)
-                if sheet_data:
-                    all_data[sheet_name] = sheet_data
-                    print(f"  SUCCESS: Successfully processed '{sheet_name}' - {len(sheet_data)} data points")
-                else:
-                    print(f"  WARNING: '{sheet_name}' appears to be empty or unreadable")
-                    
-            except Exception as e:
-                print(f"  ERROR: Error reading sheet '{sheet_name}': {e}")
-                continue
+                
+                logger.info(f"Found {len(sheet_names)} sheets: {sheet_names}")
+                
+                # The workbook reader is not thread-safe, so rows are pulled here
+                # and each sheet's parsing is handed to a worker as soon as it is read
+                with ThreadPoolExecutor(max_workers=max(1, min(MAX_SHEET_WORKERS, len(sheet_names)))) as executor:
+                    futures = {}
+                    for sheet_name in sheet_names:
+                        try:
+                            rows = list(read_rows(sheet_name))
+                        except Exception as e:
+                            # report the read failure with the sheet's result below
+                            futures[sheet_name] = Future()
+                            futures[sheet_name].set_exception(e)
+                            continue
+                        futures[sheet_name] = executor.submit(read_sheet_comprehensive, rows, sheet_name)
+                
+                # one summary line per sheet
+                for sheet_name, future in futures.items():
+                    try:
+                        # Read the sheet with different strategies
+                        sheet_data = future.result()
+                        if sheet_data:
+                            all_data[sheet_name] = sheet_data
+                            info = sheet_data['sheet_info']
+                            logger.info(f"Processed sheet '{sheet_name}': {len(info['tables'])} tables, "
+                                        f"{len(info['key_value_pairs'])} key-value pairs")
+                        else:
+                            logger.warning(f"Sheet '{sheet_name}' appears to be empty or unreadable")
+                            
+                    except Exception as e:
+                        logger.error(f"Error reading sheet '{sheet_name}': {e}")
+                        continue
+            finally:
+                close()
         
-        excel_file.close()
-        print(f"\nSUCCESS: Completed processing all sheets")
+        logger.info("Completed processing all sheets")
         return all_data
         
     except Exception as e:
-        print(f"Error reading Excel file: {e}")
+        logger.error(f"Error reading Excel file: {e}")
         return {}
 
-def read_sheet_comprehensive(excel_file, sheet_name: str, file_path: str) -> Dict[str, Any]:
+def open_sheet_reader(file_path: str):
+    """
+    Open a workbook for a single values-only pass over its sheets.
+    
+    Uses python-calamine when installed, otherwise openpyxl in read-only mode.
+    Returns (sheet_names, read_rows, close) where read_rows(sheet_name)
+    yields each row of the sheet as a sequence of cell values.
+    """
+    if CalamineWorkbook is not None:
+        workbook = CalamineWorkbook.from_path(file_path)
+        
+        def read_rows(sheet_name):
+            return workbook.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False)
+        
+        return workbook.sheet_names, read_rows, workbook.close
+    
+    workbook = load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+    
+    def read_rows(sheet_name):
+        return workbook[sheet_name].iter_rows(values_only=True)
+    
+    return workbook.sheetnames, read_rows, workbook.close
+
+def read_sheet_comprehensive(sheet_rows, sheet_name: str) -> Dict[str, Any]:
     """
     Read a single sheet comprehensively with multiple strategies.
     
     Args:
-        excel_file: pandas ExcelFile object
+        sheet_rows: Iterable of cell-value rows (read once, header variants are built in memory)
         sheet_name: Name of the sheet to read
-        file_path: Path to the Excel file (for fallback reading)
         
     Returns:
         Dictionary containing all data from the sheet
@@ -71,7 +144,6 @@ def read_sheet_comprehensive(excel_file, sheet_name: str, file_path: str) -> Dic
     sheet_data = {
         'sheet_info': {
             'name': sheet_name,
-            'raw_data': [],
             'tables': [],
             'key_value_pairs': {},
             'calculated_values': {}
@@ -79,52 +151,64 @@ def read_sheet_comprehensive(excel_file, sheet_name: str, file_path: str) -> Dic
     }
     
     try:
+        rows = read_sheet_rows(sheet_rows)
+        
         # Strategy 1: Read entire sheet without headers to capture everything
-        df_raw = pd.read_excel(
-            excel_file, 
-            sheet_name=sheet_name, 
-            header=None,
-            engine='openpyxl'
-        )
+        df_raw = frame_from_rows(rows)
+        text = None
         
         if not df_raw.empty:
-            # Convert to records for JSON serialization
-            raw_records = df_raw.fillna('').to_dict('records')
-            sheet_data['sheet_info']['raw_data'] = raw_records
+            # Keep raw cells as one array; export_comprehensive_data expands
+            # them into per-row records only while writing the file
+            raw_values = df_raw.to_numpy(dtype=object)
+            sheet_data['sheet_info']['raw_cells'] = _fill_empty(raw_values)
             sheet_data['sheet_info']['dimensions'] = {
                 'rows': len(df_raw),
                 'columns': len(df_raw.columns)
             }
             
+            # Stripped text of every cell, shared by the extractors below
+            text = _cell_text(raw_values)
+            
             # Extract key-value pairs (look for patterns like "Label: Value")
-            key_value_pairs = extract_key_value_pairs(df_raw)
+            key_value_pairs = extract_key_value_pairs(df_raw, text)
             if key_value_pairs:
                 sheet_data['sheet_info']['key_value_pairs'] = key_value_pairs
             
+            # Near-empty (template) sheets hold no tables worth scanning for
+            if np.count_nonzero(text != '') < SPARSE_SHEET_CELLS:
+                sheet_data['sheet_info']['skipped_reason'] = 'sparse'
+                return sheet_data
+            
             # Try to detect and extract tables
-            tables = detect_and_extract_tables(df_raw)
+            tables = detect_and_extract_tables(df_raw, text)
             if tables:
                 sheet_data['sheet_info']['tables'] = tables
         
-        # Strategy 2: Try reading with different header assumptions
-        for header_row in [0, 1, 2, 5, 10, 15, 20]:
+        # Strategy 2: Try reading with different header assumptions, unless
+        # Strategy 1 already found proper tables (3+ headers)
+        found_tables = sheet_data['sheet_info']['tables']
+        skip_strategy_2 = bool(found_tables) and max(len(t['headers']) for t in found_tables) >= 3
+        found_header_rows = {t['header_row_index'] for t in found_tables}
+        
+        for header_row in ([] if skip_strategy_2 else [0, 1, 2, 5, 10, 15, 20]):
+            if header_row in found_header_rows:
+                continue  # same header row already extracted by Strategy 1
             try:
-                df_with_header = pd.read_excel(
-                    excel_file,
-                    sheet_name=sheet_name,
-                    header=header_row,
-                    engine='openpyxl'
-                )
+                df_with_header = frame_from_rows(rows, header=header_row)
                 
                 if not df_with_header.empty and len(df_with_header.columns) > 1:
                     table_data = {
                         'header_row': header_row,
                         'columns': list(df_with_header.columns),
-                        'data': df_with_header.fillna('').to_dict('records')
+                        'data': _records(df_with_header)
                     }
                     
-                    # Only add if it looks like a proper table (has meaningful column names)
-                    if any(str(col).strip() and str(col) != 'Unnamed' in str(col) for col in df_with_header.columns):
+                    # Only add if it looks like a proper table (has meaningful column names,
+                    # i.e. not blank and not pandas' "Unnamed: N" placeholders)
+                    columns = df_with_header.columns.astype(str)
+                    has_meaningful = (columns.str.strip() != '') & ~columns.str.startswith('Unnamed')
+                    if has_meaningful.any():
                         sheet_data['sheet_info']['tables'].append(table_data)
                         
             except Exception:
@@ -132,83 +216,107 @@ def read_sheet_comprehensive(excel_file, sheet_name: str, file_path: str) -> Dic
         
         # Strategy 3: Extract calculated values (cells that might contain formulas)
         # Note: We can only get the calculated values, not the formulas themselves
-        calculated_values = extract_calculated_values(df_raw)
+        calculated_values = extract_calculated_values(df_raw, text)
         if calculated_values:
             sheet_data['sheet_info']['calculated_values'] = calculated_values
             
     except Exception as e:
-        print(f"    Error in comprehensive reading: {e}")
+        logger.error(f"Error in comprehensive reading of sheet '{sheet_name}': {e}")
     
     return sheet_data
 
-def extract_key_value_pairs(df: pd.DataFrame) -> Dict[str, Any]:
+def extract_key_value_pairs(df: pd.DataFrame, text: Optional[np.ndarray] = None) -> Dict[str, Any]:
     """
     Extract key-value pairs from a DataFrame.
     Looks for patterns where column 0 contains keys and column 1 contains values.
+    text is the sheet's precomputed stripped cell text (see _cell_text).
     """
     key_value_pairs = {}
     
     if len(df.columns) < 2:
         return key_value_pairs
     
-    for index, row in df.iterrows():
-        key = str(row.iloc[0]).strip() if pd.notna(row.iloc[0]) else ""
-        value = str(row.iloc[1]).strip() if pd.notna(row.iloc[1]) else ""
-        
-        # Clean up key (remove colons, extra spaces)
-        key_clean = key.replace(':', '').strip()
-        
-        # Only add if both key and value are meaningful
-        if (key_clean and value and 
-            key_clean.lower() not in ['nan', 'none', ''] and 
-            value.lower() not in ['nan', 'none', '']):
-            key_value_pairs[key_clean] = value
+    if text is None:
+        text = _cell_text(df.to_numpy(dtype=object))
+    
+    # Clean up keys (remove colons, extra spaces) in one vectorized pass
+    keys = pd.Series(text[:, 0], dtype=object).str.replace(':', '', regex=False).str.strip()
+    values = pd.Series(text[:, 1], dtype=object)
+    
+    # Only keep pairs where both key and value are meaningful
+    mask = (~keys.str.lower().isin(EMPTY_TEXT_VALUES).to_numpy()
+            & ~values.str.lower().isin(EMPTY_TEXT_VALUES).to_numpy())
+    key_value_pairs.update(zip(keys.to_numpy()[mask].tolist(), values.to_numpy()[mask].tolist()))
     
     return key_value_pairs
 
-def detect_and_extract_tables(df: pd.DataFrame) -> List[Dict[str, Any]]:
+def _table_end_rows_numpy(nonempty: np.ndarray, header_rows: np.ndarray,
+                          widths: np.ndarray, max_rows: int) -> np.ndarray:
+    """Return, per header row, the index of the first row past its table."""
+    end_rows = np.empty(len(header_rows), dtype=np.int64)
+    n_rows = nonempty.shape[0]
+    for i in range(len(header_rows)):
+        start = header_rows[i] + 1
+        stop = min(header_rows[i] + max_rows, n_rows)
+        has_data = nonempty[start:stop, :widths[i]].any(axis=1)
+        end_rows[i] = start + (np.argmin(has_data) if not has_data.all() else len(has_data))
+    return end_rows
+
+def _table_end_rows_loop(nonempty, header_rows, widths, max_rows):
+    """Same as _table_end_rows_numpy as a plain integer loop, for numba to compile."""
+    end_rows = np.empty(len(header_rows), dtype=np.int64)
+    n_rows = nonempty.shape[0]
+    for i in range(len(header_rows)):
+        row = header_rows[i] + 1
+        stop = min(header_rows[i] + max_rows, n_rows)
+        while row < stop:
+            has_data = False
+            for col in range(widths[i]):
+                if nonempty[row, col]:
+                    has_data = True
+                    break
+            if not has_data:
+                break
+            row += 1
+        end_rows[i] = row
+    return end_rows
+
+_table_end_rows = njit(cache=True)(_table_end_rows_loop) if njit else _table_end_rows_numpy
+
+def detect_and_extract_tables(df: pd.DataFrame, text: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
     """
     Detect and extract tabular data from a DataFrame.
+    text is the sheet's precomputed stripped cell text (see _cell_text).
     """
     tables = []
     
     if df.empty:
         return tables
     
-    # Look for rows that might be headers (contain multiple non-empty values)
-    potential_header_rows = []
+    if text is None:
+        text = _cell_text(df.to_numpy(dtype=object))
     
-    for index, row in df.iterrows():
-        non_empty_count = sum(1 for val in row if pd.notna(val) and str(val).strip())
-        if non_empty_count >= 3:  # At least 3 columns with data
-            potential_header_rows.append(index)
+    # Look for rows that might be headers (at least 3 columns with data)
+    nonempty = text != ''
+    non_empty_counts = nonempty.sum(axis=1)
+    potential_header_rows = np.flatnonzero(non_empty_counts >= 3)
+    
+    # Each table spans from its header to the first row (within the next 50)
+    # with nothing in the first len(headers) columns
+    end_rows = _table_end_rows(nonempty.view(np.uint8), potential_header_rows,
+                               non_empty_counts[potential_header_rows], TABLE_SCAN_ROWS)
     
     # For each potential header, try to extract a table
-    for header_idx in potential_header_rows:
+    for header_idx, end_row in zip(potential_header_rows.tolist(), end_rows.tolist()):
         try:
             # Extract potential header
-            header_row = df.iloc[header_idx]
-            headers = [str(val).strip() for val in header_row if pd.notna(val) and str(val).strip()]
+            headers = [val for val in text[header_idx] if val]
             
             if len(headers) >= 3:  # Valid table should have at least 3 columns
                 # Extract data rows following the header
                 data_rows = []
-                for data_idx in range(header_idx + 1, min(header_idx + 50, len(df))):  # Look at next 50 rows max
-                    data_row = df.iloc[data_idx]
-                    row_data = {}
-                    has_data = False
-                    
-                    for col_idx, header in enumerate(headers):
-                        if col_idx < len(data_row):
-                            value = data_row.iloc[col_idx]
-                            if pd.notna(value) and str(value).strip():
-                                row_data[header] = str(value).strip()
-                                has_data = True
-                    
-                    if has_data:
-                        data_rows.append(row_data)
-                    else:
-                        break  # Stop at first empty row
+                for data_row in text[header_idx + 1:end_row]:
+                    data_rows.append({header: value for header, value in zip(headers, data_row) if value})
                 
                 if data_rows:  # Only add if we found data
                     table = {
@@ -224,71 +332,68 @@ def detect_and_extract_tables(df: pd.DataFrame) -> List[Dict[str, Any]]:
     
     return tables
 
-def extract_calculated_values(df: pd.DataFrame) -> Dict[str, Any]:
+def extract_calculated_values(df: pd.DataFrame, text: Optional[np.ndarray] = None) -> Dict[str, Any]:
     """
     Extract values that might be results of calculations or formulas.
     Since we can't access the formulas directly, we look for numeric patterns.
+    text is the sheet's precomputed stripped cell text (see _cell_text).
     """
     calculated_values = {}
     
     if df.empty:
         return calculated_values
     
-    # Look for numeric values that might be calculated
-    numeric_cells = []
+    # Look for numeric values that might be calculated: coerce every cell in
+    # one vectorized pass (non-numeric becomes NaN) and visit only the hits
+    vals = df.to_numpy(dtype=object)
+    num = pd.to_numeric(vals.ravel(), errors='coerce').reshape(vals.shape)
+    numeric_mask = ~np.isnan(num)
     
-    for row_idx in range(len(df)):
-        for col_idx in range(len(df.columns)):
-            cell_value = df.iloc[row_idx, col_idx]
-            
-            if pd.notna(cell_value):
-                # Try to convert to numeric
-                try:
-                    numeric_value = pd.to_numeric(cell_value)
-                    if not pd.isna(numeric_value):
-                        # Look for context (label in adjacent cells)
-                        context = find_cell_context(df, row_idx, col_idx)
-                        
-                        numeric_cells.append({
-                            'position': f'{row_idx},{col_idx}',
-                            'value': numeric_value,
-                            'context': context,
-                            'row': row_idx,
-                            'column': col_idx
-                        })
-                except:
-                    continue
-    
-    if numeric_cells:
-        calculated_values['numeric_values'] = numeric_cells
+    # Text-only sheets (e.g. overviews) have nothing to report
+    if not numeric_mask.any():
+        return calculated_values
+    
+    # Stripped text of every cell ('' when empty) in a frame padded by one row
+    # and column, so each cell lines up with its left/above/top-left neighbour
+    padded = np.full((vals.shape[0] + 1, vals.shape[1] + 1), '', dtype=object)
+    padded[1:, 1:] = _cell_text(vals) if text is None else text
+    left, above, topleft = padded[1:, :-1], padded[:-1, 1:], padded[:-1, :-1]
+    
+    # numeric text (e.g. '42') is reported as its parsed number
+    values = [value if isinstance(value, (int, float)) else pd.to_numeric(value)
+              for value in vals[numeric_mask].tolist()]
+    
+    # Look for context (label in adjacent cells)
+    contexts = [" | ".join(part for part in (f"Left: {left_text}" if left_text else '',
+                                             f"Above: {above_text}" if above_text else '',
+                                             f"TopLeft: {topleft_text}" if topleft_text else '') if part)
+                for left_text, above_text, topleft_text in zip(left[numeric_mask].tolist(),
+                                                               above[numeric_mask].tolist(),
+                                                               topleft[numeric_mask].tolist())]
+    
+    # Parallel per-cell lists (row-major order) rather than one dict per cell
+    rows, columns = np.nonzero(numeric_mask)
+    calculated_values['numeric_values'] = {
+        'rows': rows.tolist(),
+        'columns': columns.tolist(),
+        'values': values,
+        'contexts': contexts
+    }
     
     return calculated_values
 
-def find_cell_context(df: pd.DataFrame, row_idx: int, col_idx: int) -> str:
-    """
-    Find contextual information for a cell by looking at adjacent cells.
-    """
-    context_parts = []
-    
-    # Check left cell (same row, previous column)
-    if col_idx > 0:
-        left_value = df.iloc[row_idx, col_idx - 1]
-        if pd.notna(left_value) and str(left_value).strip():
-            context_parts.append(f"Left: {str(left_value).strip()}")
-    
-    # Check cell above (previous row, same column)
-    if row_idx > 0:
-        above_value = df.iloc[row_idx - 1, col_idx]
-        if pd.notna(above_value) and str(above_value).strip():
-            context_parts.append(f"Above: {str(above_value).strip()}")
-    
-    # Check top-left cell for potential labels
-    if row_idx > 0 and col_idx > 0:
-        topleft_value = df.iloc[row_idx - 1, col_idx - 1]
-        if pd.notna(topleft_value) and str(topleft_value).strip():
-            context_parts.append(f"TopLeft: {str(topleft_value).strip()}")
-    
-    return " | ".join(context_parts) if context_parts else ""
+def _fill_empty(vals: np.ndarray) -> np.ndarray:
+    """Replace missing cells (NaN/None/NaT) in an object array with ''."""
+    return np.where(pd.isna(vals), '', vals)
+
+def _records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Equivalent of df.fillna('').to_dict('records') with a single fill pass."""
+    columns = list(df.columns)
+    return [dict(zip(columns, row)) for row in _fill_empty(df.to_numpy(dtype=object)).tolist()]
+
+def _cell_text(vals: np.ndarray) -> np.ndarray:
+    """Map an object array to stripped cell strings, '' for empty cells."""
+    return np.frompyfunc(lambda val: str(val).strip() if pd.notna(val) else '', 1, 1)(vals)
 
 def read_build_data() -> Optional[Dict[str, Any]]:
     """
@@ -298,16 +403,16 @@ def read_build_data() -> Optional[Dict[str, Any]]:
     
     excel_file = config.get_excel_file_path()
     if not excel_file:
-        print(f"ERROR: No Excel file found in '{config.EXCEL_INPUT_DIRECTORY}'")
+        logger.error(f"No Excel file found in '{config.EXCEL_INPUT_DIRECTORY}'")
         return None
     
-    print(f"Reading comprehensive data from '{excel_file}'...")
+    logger.info(f"Reading comprehensive data from '{excel_file}'...")
     
     # Read all sheets comprehensively
     all_sheets_data = read_all_sheets_comprehensive(excel_file)
     
     if not all_sheets_data:
-        print("Failed to read any data from Excel file.")
+        logger.error("Failed to read any data from Excel file.")
         return None
     
     # Process the data to extract build information
@@ -315,9 +420,12 @@ def read_build_data() -> Optional[Dict[str, Any]]:
     
     return build_data
 
-def process_comprehensive_data(all_sheets_data: Dict[str, Any]) -> Dict[str, Any]:
+def process_comprehensive_data(all_sheets_data: Dict[str, Any], include_raw: bool = False) -> Dict[str, Any]:
     """
     Process comprehensive sheet data to extract build information.
+    
+    The sheet data itself is only attached (as 'raw_sheets_data') when
+    include_raw is set; use export_comprehensive_data to dump it instead.
     """
     import config
     
@@ -325,9 +433,10 @@ def process_comprehensive_data(all_sheets_data: Dict[str, Any]) -> Dict[str, Any
         'source_file_info': {
             'sheets_found': list(all_sheets_data.keys()),
             'total_sheets': len(all_sheets_data)
-        },
-        'raw_sheets_data': all_sheets_data  # Include all raw data
+        }
     }
+    if include_raw:
+        build_data['raw_sheets_data'] = all_sheets_data
     
     # Try to extract standard build data from known sheet patterns
     overview_data = {}
@@ -341,19 +450,21 @@ def process_comprehensive_data(all_sheets_data: Dict[str, Any]) -> Dict[str, Any
         kv_pairs = sheet_info.get('key_value_pairs', {})
         if kv_pairs:
             overview_data.update(kv_pairs)
-            print(f"Found {len(kv_pairs)} key-value pairs in sheet '{sheet_name}'")
         
         # Extract table data (potential VM data)
+        sheet_vms = 0
         tables = sheet_info.get('tables', [])
         for table in tables:
             table_data = table.get('data', [])
             if table_data:
                 # Check if this looks like VM data (has hostname-like columns)
                 headers = table.get('headers', [])
-                if any(keyword in str(header).lower() for header in headers 
-                       for keyword in ['host', 'vm', 'server', 'machine', 'instance']):
+                if any(VM_HEADER_RE.search(str(header)) for header in headers):
                     vm_data.extend(table_data)
-                    print(f"Found {len(table_data)} VM entries in sheet '{sheet_name}'")
+                    sheet_vms += len(table_data)
+        
+        if kv_pairs or sheet_vms:
+            logger.info(f"Sheet '{sheet_name}': {len(kv_pairs)} key-value pairs, {sheet_vms} VM entries")
     
     # Map extracted data to standard fields
     field_mapping = config.EXCEL_TO_TERRAFORM_MAPPING
@@ -372,30 +483,50 @@ def process_comprehensive_data(all_sheets_data: Dict[str, Any]) -> Dict[str, Any
         if field not in build_data or not build_data[field]:
             if field in config.DEFAULT_VALUES:
                 build_data[field] = config.DEFAULT_VALUES[field]
-                print(f"Using default value for {field}: {build_data[field]}")
+                logger.info(f"Using default value for {field}: {build_data[field]}")
     
-    print(f"\nProcessing Summary:")
-    print(f"  Sheets processed: {len(all_sheets_data)}")
-    print(f"  Key-value pairs found: {len(overview_data)}")
-    print(f"  VM instances found: {len(vm_data)}")
+    logger.info(f"Processing summary: {len(all_sheets_data)} sheets, "
+                f"{len(overview_data)} key-value pairs, {len(vm_data)} VM instances")
     
     return build_data
 
+def _sheet_for_export(sheet_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a sheet with its raw cell array expanded to row records for JSON."""
+    info = sheet_data.get('sheet_info')
+    if not isinstance(info, dict):
+        return sheet_data
+    
+    cells = info.get('raw_cells')
+    export_info = {
+        'name': info.get('name'),
+        'raw_data': [dict(enumerate(row)) for row in cells.tolist()] if cells is not None else []
+    }
+    export_info.update((key, value) for key, value in info.items() if key not in ('name', 'raw_cells'))
+    return {**sheet_data, 'sheet_info': export_info}
+
 def export_comprehensive_data(all_sheets_data: Dict[str, Any], output_file: str = "comprehensive_excel_data.json"):
     """
     Export all comprehensive data to a JSON file for review.
     """
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(all_sheets_data, f, indent=2, default=str)
-        print(f"SUCCESS: Comprehensive data exported to: {output_file}")
+        # Serialize one sheet at a time straight to the file
+        with open(output_file, 'wb') as f:
+            f.write(b'{')
+            for i, (sheet_name, sheet_data) in enumerate(all_sheets_data.items()):
+                f.write(b',\n  ' if i else b'\n  ')
+                sheet_json = _dumps(_sheet_for_export(sheet_data))
+                f.write(_dumps(str(sheet_name)) + b': ' + sheet_json.replace(b'\n', b'\n  '))
+            f.write(b'\n}' if all_sheets_data else b'}')
+        logger.info(f"Comprehensive data exported to: {output_file}")
         return True
     except Exception as e:
-        print(f"Error exporting comprehensive data: {e}")
+        logger.error(f"Error exporting comprehensive data: {e}")
         return False
 
 if __name__ == '__main__':
     """Test the comprehensive Excel reading functionality."""
+    logging.basicConfig(level=logging.INFO, format='%(message)s', handlers=[logging.StreamHandler()])
+    
     print("Testing Comprehensive Excel Data Reading...")
     print("=" * 60)
     
@@ -423,9 +554,7 @@ if __name__ == '__main__':
         print("=" * 60)
         
         for key, value in build_data.items():
-            if key == 'raw_sheets_data':
-                print(f"{key}: [Raw data - {len(value)} sheets]")
-            elif isinstance(value, list):
+            if isinstance(value, list):
                 print(f"{key}: [{len(value)} items]")
             elif isinstance(value, dict):
                 print(f"{key}: {{{len(value)} keys}}")
@@ -1,9 +1,70 @@
+import io
 import json
 import datetime
+import functools
 import os
-from typing import Dict, Any, List, Optional
+import re
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
-def create_terraform_json(data: Dict[str, Any], output_filename: str = "terraform_variables.json") -> bool:
+import config
+from excel_io import _dumps
+
+# Leading number in disk sizes like "128 GB", "256GB", "1TB"
+_DISK_RE = re.compile(r'(\d+)')
+
+# VM count from which process_vm_instances fans out to worker processes
+# (when config.PARALLEL_VM_PROCESSING is on); below it startup costs dominate
+PARALLEL_VM_THRESHOLD = 200
+
+# The same project/app names recur for every VM, so normalize each only once
+_normalize_name = functools.lru_cache(maxsize=256)(config.normalize_resource_name)
+
+# Optional VM config fields and the Excel columns they are copied from
+_OPTIONAL_VM_FIELDS = (
+    ("subscription_name", 'Subscription Name'),
+    ("network_security_group", 'Network Security Group'),
+    ("subnet_name", 'Subnet'),
+    ("virtual_network", 'Virtual Network'),
+    ("availability_zone", 'Availability Zone'),
+    ("disk_type", 'Disk Type'),
+)
+
+# Hostname tokens per role/environment, in priority order. The lookahead
+# reports a match at every position so one scan finds all categories present.
+_ROLE_ORDER = ('web', 'application', 'database', 'cache', 'loadbalancer')
+_ROLE_RE = re.compile(r'(?=(?P<web>web|www|frontend|ui)'
+                      r'|(?P<application>api|app|application|backend)'
+                      r'|(?P<database>db|database|sql|mysql|postgres)'
+                      r'|(?P<cache>cache|redis|memcache)'
+                      r'|(?P<loadbalancer>lb|loadbalancer|proxy))')
+_ENV_ORDER = ('prod', 'dev', 'test', 'stage')
+_ENV_RE = re.compile(r'(?=(?P<prod>prod|production)'
+                     r'|(?P<dev>dev|development)'
+                     r'|(?P<test>test|qa|testing)'
+                     r'|(?P<stage>stage|staging))')
+
+# Write buffer for the output file, large enough to batch json.dump's small writes
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# How much of the written file the debug preview reads back
+_PREVIEW_BYTES = 8192
+
+def _dump(obj: Any, f, indent: int = 2, sort_keys: bool = False) -> None:
+    """Serialize to UTF-8 JSON into a binary file, using orjson when available."""
+    # orjson only supports two-space indentation
+    if indent == 2:
+        f.write(_dumps(obj, sort_keys=sort_keys))
+        return
+    
+    # stream through the buffered file rather than building the whole string
+    text = io.TextIOWrapper(f, encoding='utf-8')
+    json.dump(obj, text, indent=indent, sort_keys=sort_keys, ensure_ascii=False)
+    text.flush()
+    text.detach()
+
+def create_terraform_json(data: Dict[str, Any], output_filename: str = "terraform_variables.json") -> int:
     """
     Translates build data into structured JSON suitable for Terraform variable files.
     
@@ -12,36 +73,41 @@ def create_terraform_json(data: Dict[str, Any], output_filename: str = "terrafor
         output_filename (str): The name of the output JSON file.
         
     Returns:
-        bool: True if the file is created successfully, False otherwise.
+        int: Number of bytes written, or 0 if the file could not be created.
     """
     print(f"Translating build data into Terraform JSON format...")
     
     try:
-        # Import config here to avoid circular imports
-        import config
+        # Parse the environments once; every section below reuses these
+        primary_env = extract_primary_environment(data.get('environments', 'dev'))
+        default_rg = generate_resource_group_name(data, primary_env)
         
-        # Generate metadata
-        current_time = datetime.datetime.now().isoformat()
+        # Read the clock once; metadata and every tag set share this timestamp
+        now = datetime.datetime.now()
+        default_tags = generate_resource_tags(data, primary_env, now.strftime('%Y-%m-%d'))
         
         # --- Build the main Terraform variables structure ---
-        terraform_variables = {
-            # Metadata section (if enabled in config)
-            "metadata": {
-                "generated_at": current_time,
+        terraform_variables = {}
+        
+        # Metadata section (if enabled in config), serialized first
+        if config.INCLUDE_METADATA:
+            terraform_variables["metadata"] = {
+                "generated_at": now.isoformat(timespec='seconds'),
                 "source_file": config.get_excel_file_path() or "sourcefiles",
                 "generator_version": "1.0.0",
                 "project_name": data.get('project_name', 'Unknown Project'),
                 "application_name": data.get('application_name', 'Unknown Application')
-            } if config.INCLUDE_METADATA else {},
-            
+            }
+        
+        terraform_variables.update({
             # Global configuration
-            "project_name": config.normalize_resource_name(data.get('project_name', 'default-project')),
-            "application_name": config.normalize_resource_name(data.get('application_name', 'default-app')),
-            "environment": extract_primary_environment(data.get('environments', 'dev')),
+            "project_name": _normalize_name(data.get('project_name', 'default-project')),
+            "application_name": _normalize_name(data.get('application_name', 'default-app')),
+            "environment": primary_env,
             "location": config.DEFAULT_AZURE_REGION,
             
             # Resource group configuration
-            "resource_group_name": generate_resource_group_name(data),
+            "resource_group_name": default_rg,
             
             # Application metadata
             "application_config": {
@@ -54,70 +120,71 @@ def create_terraform_json(data: Dict[str, Any], output_filename: str = "terrafor
             },
             
             # Virtual machines configuration
-            "virtual_machines": process_vm_instances(data.get('vm_instances', []), data),
+            "virtual_machines": process_vm_instances(data.get('vm_instances', []), data, primary_env,
+                                                     default_rg, default_tags),
             
             # Resource tagging strategy
-            "default_tags": generate_resource_tags(data),
+            "default_tags": default_tags,
             
             # Networking configuration (if VM data includes network info)
             "networking": extract_networking_config(data.get('vm_instances', [])),
-        }
-        
-        # Remove empty metadata section if not including metadata
-        if not config.INCLUDE_METADATA or not terraform_variables["metadata"]:
-            terraform_variables.pop("metadata", None)
-        
-        # Convert to formatted JSON
-        json_output = json.dumps(
-            terraform_variables, 
-            indent=config.JSON_INDENT,
-            sort_keys=config.JSON_SORT_KEYS,
-            ensure_ascii=False
-        )
+        })
         
-        # Save JSON to specified output file
-        with open(output_filename, 'w', encoding='utf-8') as f:
-            f.write(json_output)
+        # Save formatted JSON to specified output file
+        with open(output_filename, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            _dump(
+                terraform_variables,
+                f,
+                indent=config.JSON_INDENT,
+                sort_keys=config.JSON_SORT_KEYS
+            )
+            nbytes = f.tell()
         
         print(f"Successfully generated Terraform variables file: '{output_filename}'")
         
         # Show preview if debug mode is enabled
         if hasattr(config, 'DEBUG_MODE') and config.DEBUG_MODE:
             print("\n--- Terraform JSON Preview (first 50 lines) ---")
-            preview_lines = json_output.split('\n')[:50]
-            print('\n'.join(preview_lines))
-            if len(json_output.split('\n')) > 50:
+            with open(output_filename, 'rb') as f:
+                json_output = f.read(_PREVIEW_BYTES).decode('utf-8', errors='ignore')
+            # end of the 50th line, found without splitting the text into lines
+            end = -1
+            for _ in range(50):
+                end = json_output.find('\n', end + 1)
+                if end == -1:
+                    break
+            print(json_output if end == -1 else json_output[:end])
+            if nbytes > _PREVIEW_BYTES or (end != -1 and end + 1 < len(json_output)):
                 print("... (truncated)")
             print("--- End Preview ---")
         
-        # Print summary
-        print(f"\nGeneration Summary:")
-        print(f"  Project: {terraform_variables['project_name']}")
-        print(f"  Application: {terraform_variables['application_name']}")
-        print(f"  Environment: {terraform_variables['environment']}")
-        print(f"  Virtual Machines: {len(terraform_variables['virtual_machines'])}")
-        print(f"  Output file size: {len(json_output):,} characters")
+        # Print summary in a single write, debug mode only
+        if getattr(config, 'DEBUG_MODE', False):
+            print(f"\nGeneration Summary:\n"
+                  f"  Project: {terraform_variables['project_name']}\n"
+                  f"  Application: {terraform_variables['application_name']}\n"
+                  f"  Environment: {terraform_variables['environment']}\n"
+                  f"  Virtual Machines: {len(terraform_variables['virtual_machines'])}\n"
+                  f"  Output file size: {nbytes:,} bytes")
         
-        return True
+        return nbytes
         
     except Exception as e:
         print(f"An error occurred while generating the Terraform JSON file: {e}")
-        import traceback
         traceback.print_exc()
-        return False
+        return 0
 
-def generate_resource_group_name(data: Dict[str, Any]) -> str:
+def generate_resource_group_name(data: Dict[str, Any], primary_env: Optional[str] = None) -> str:
     """Generate a standardized resource group name."""
-    import config
-    
-    app_name = config.normalize_resource_name(data.get('application_name', 'default-app'))
-    env = extract_primary_environment(data.get('environments', 'dev'))
+    app_name = _normalize_name(data.get('application_name', 'default-app'))
+    env = primary_env or extract_primary_environment(data.get('environments', 'dev'))
     
     # Standard Azure resource group naming: rg-{app}-{env}
     rg_name = f"rg-{app_name}-{env}"
     
     return rg_name
 
+@functools.lru_cache(maxsize=64)
 def extract_primary_environment(environments_str: str) -> str:
     """Extract the primary environment from a comma-separated string."""
     if not environments_str:
@@ -139,57 +206,89 @@ def extract_primary_environment(environments_str: str) -> str:
     
     return env_mapping.get(primary_env, primary_env)
 
-def parse_environments(environments_str: str) -> List[str]:
-    """Parse comma-separated environments into a list."""
+@functools.lru_cache(maxsize=64)
+def parse_environments(environments_str: str) -> Tuple[str, ...]:
+    """Parse comma-separated environments into a tuple (cached, so immutable)."""
     if not environments_str:
-        return ['dev']
+        return ('dev',)
     
-    return [env.strip().lower() for env in environments_str.split(',') if env.strip()]
+    return tuple(env.strip().lower() for env in environments_str.split(',') if env.strip())
 
-def process_vm_instances(vm_instances: List[Dict], global_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Process VM instances from Excel data into Terraform format."""
-    import config
+def process_vm_instances(vm_instances: List[Dict], global_data: Dict[str, Any],
+                         primary_env: Optional[str] = None,
+                         default_rg: Optional[str] = None,
+                         base_tags: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+    """
+    Process VM instances from Excel data into Terraform format.
     
-    processed_vms = []
+    primary_env, default_rg and base_tags are derived from global_data when not given.
+    Large inventories are split across worker processes when
+    config.PARALLEL_VM_PROCESSING is enabled.
+    """
+    # global values are the same for every VM, build them once
+    primary_env = primary_env or extract_primary_environment(global_data.get('environments', 'dev'))
+    default_rg = default_rg or generate_resource_group_name(global_data, primary_env)
+    if base_tags is None:
+        base_tags = generate_resource_tags(global_data, primary_env)
+    
+    # bind config lookups once rather than per VM
+    defaults = (config.DEFAULT_VM_SIZE, config.DEFAULT_OS_IMAGE,
+                config.DEFAULT_ADMIN_USERNAME, config.DEFAULT_AZURE_REGION)
+    process_one = functools.partial(_process_one_vm, global_data=global_data, primary_env=primary_env,
+                                    default_rg=default_rg, base_tags=base_tags,
+                                    defaults=defaults, skip_empty=config.SKIP_EMPTY_VMS)
+    
+    if (len(vm_instances) >= PARALLEL_VM_THRESHOLD
+            and getattr(config, 'PARALLEL_VM_PROCESSING', False)):
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(process_one, enumerate(vm_instances), chunksize=64))
+    else:
+        results = map(process_one, enumerate(vm_instances))
     
-    for i, vm in enumerate(vm_instances):
-        # Skip empty VMs if configured to do so
-        if config.SKIP_EMPTY_VMS and not vm.get('Hostname', '').strip():
-            continue
-        
-        # Extract and normalize VM data
-        hostname = config.normalize_resource_name(vm.get('Hostname', f'vm-{i+1}'))
-        
-        vm_config = {
-            "name": hostname,
-            "hostname": hostname,
-            "resource_group": vm.get('App RG', generate_resource_group_name(global_data)),
-            "vm_size": vm.get('Recommended SKU', config.DEFAULT_VM_SIZE),
-            "os_image": vm.get('OS Image*', config.DEFAULT_OS_IMAGE),
-            "admin_username": vm.get('Admin Username', config.DEFAULT_ADMIN_USERNAME),
-            "environment": extract_vm_environment(vm, global_data),
-            "location": vm.get('Location', config.DEFAULT_AZURE_REGION),
-            
-            # Optional fields (only include if present)
-            **{k: v for k, v in {
-                "subscription_name": vm.get('Subscription Name'),
-                "network_security_group": vm.get('Network Security Group'),
-                "subnet_name": vm.get('Subnet'),
-                "virtual_network": vm.get('Virtual Network'),
-                "availability_zone": vm.get('Availability Zone'),
-                "disk_type": vm.get('Disk Type'),
-                "disk_size_gb": parse_disk_size(vm.get('Disk Size')),
-            }.items() if v}
-        }
-        
-        # Add VM-specific tags
-        vm_config["tags"] = generate_vm_tags(vm, global_data, hostname)
-        
-        processed_vms.append(vm_config)
+    return [vm_config for vm_config in results if vm_config is not None]
+
+def _process_one_vm(item: Tuple[int, Dict], global_data: Dict[str, Any], primary_env: str,
+                    default_rg: str, base_tags: Dict[str, str], defaults: Tuple[str, str, str, str],
+                    skip_empty: bool) -> Optional[Dict[str, Any]]:
+    """Convert one (index, VM row) pair to its Terraform config, or None if it is skipped."""
+    i, vm = item
+    default_vm_size, default_os_image, default_admin, default_region = defaults
+    
+    # Skip empty VMs if configured to do so
+    if skip_empty and not vm.get('Hostname', '').strip():
+        return None
+    
+    # Extract and normalize VM data
+    hostname = _normalize_name(vm.get('Hostname', f'vm-{i+1}'))
+    vm_env = extract_vm_environment(vm, global_data, primary_env)
+    
+    vm_config = {
+        "name": hostname,
+        "hostname": hostname,
+        "resource_group": vm.get('App RG', default_rg),
+        "vm_size": vm.get('Recommended SKU', default_vm_size),
+        "os_image": vm.get('OS Image*', default_os_image),
+        "admin_username": vm.get('Admin Username', default_admin),
+        "environment": vm_env,
+        "location": vm.get('Location', default_region),
+    }
+    
+    # Optional fields (only include if present)
+    for field, column in _OPTIONAL_VM_FIELDS:
+        value = vm.get(column)
+        if value:
+            vm_config[field] = value
+    disk_size_gb = parse_disk_size(vm.get('Disk Size'))
+    if disk_size_gb:
+        vm_config["disk_size_gb"] = disk_size_gb
+    
+    # Add VM-specific tags
+    vm_config["tags"] = generate_vm_tags(vm, base_tags, global_data, hostname, vm_env)
     
-    return processed_vms
+    return vm_config
 
-def extract_vm_environment(vm_data: Dict, global_data: Dict[str, Any]) -> str:
+def extract_vm_environment(vm_data: Dict, global_data: Dict[str, Any],
+                           primary_env: Optional[str] = None) -> str:
     """Extract environment for a specific VM."""
     # Try to get environment from VM data first
     vm_env = vm_data.get('Environment', '').strip().lower()
@@ -197,18 +296,13 @@ def extract_vm_environment(vm_data: Dict, global_data: Dict[str, Any]) -> str:
         return vm_env
     
     # Fall back to inferring from hostname
-    hostname = vm_data.get('Hostname', '').lower()
-    if any(env in hostname for env in ['prod', 'production']):
-        return 'prod'
-    elif any(env in hostname for env in ['dev', 'development']):
-        return 'dev'
-    elif any(env in hostname for env in ['test', 'qa', 'testing']):
-        return 'test'
-    elif any(env in hostname for env in ['stage', 'staging']):
-        return 'stage'
+    found = {match.lastgroup for match in _ENV_RE.finditer(vm_data.get('Hostname', '').lower())}
+    for env in _ENV_ORDER:
+        if env in found:
+            return env
     
     # Fall back to primary environment from global data
-    return extract_primary_environment(global_data.get('environments', 'dev'))
+    return primary_env or extract_primary_environment(global_data.get('environments', 'dev'))
 
 def parse_disk_size(disk_size_str: Optional[str]) -> Optional[int]:
     """Parse disk size from string to integer GB."""
@@ -216,50 +310,53 @@ def parse_disk_size(disk_size_str: Optional[str]) -> Optional[int]:
         return None
     
     # Extract number from string like "128 GB", "256GB", "1TB", etc.
-    import re
-    match = re.search(r'(\d+)', str(disk_size_str))
+    disk_size_str = str(disk_size_str)
+    match = _DISK_RE.search(disk_size_str)
     if match:
         size = int(match.group(1))
         # Convert TB to GB if needed
-        if 'tb' in str(disk_size_str).lower():
+        if 'tb' in disk_size_str.lower():
             size *= 1024
         return size
     
     return None
 
-def generate_resource_tags(data: Dict[str, Any]) -> Dict[str, str]:
-    """Generate standardized resource tags."""
-    import config
-    
-    tags = dict(config.DEFAULT_TAGS)  # Copy default tags
-    
-    # Add dynamic tags
-    tags.update({
-        "Project": data.get('project_name', 'Unknown'),
-        "Application": data.get('application_name', 'Unknown'),
-        "ApplicationTier": data.get('app_tier', 'Bronze'),
-        "Owner": data.get('app_owner', 'TBD'),
-        "BusinessOwner": data.get('business_owner', 'TBD'),
-        "Environment": extract_primary_environment(data.get('environments', 'dev')),
-        "ServiceNowTicket": data.get('service_now_ticket', 'TBD'),
-    })
+def generate_resource_tags(data: Dict[str, Any], primary_env: Optional[str] = None,
+                           generated_date: Optional[str] = None) -> Dict[str, str]:
+    """Generate standardized resource tags (empty and 'TBD' values are left out)."""
+    tags = {k: v for k, v in config.DEFAULT_TAGS.items() if v and v != 'TBD'}
+    
+    # Add dynamic tags; an empty value also drops the default of the same name
+    for key, value in (
+        ("Project", data.get('project_name', 'Unknown')),
+        ("Application", data.get('application_name', 'Unknown')),
+        ("ApplicationTier", data.get('app_tier', 'Bronze')),
+        ("Owner", data.get('app_owner', 'TBD')),
+        ("BusinessOwner", data.get('business_owner', 'TBD')),
+        ("Environment", primary_env or extract_primary_environment(data.get('environments', 'dev'))),
+        ("ServiceNowTicket", data.get('service_now_ticket', 'TBD')),
+    ):
+        if value and value != 'TBD':
+            tags[key] = value
+        else:
+            tags.pop(key, None)
     
     # Add generation timestamp if enabled
     if config.INCLUDE_GENERATION_TIMESTAMP:
-        tags["GeneratedAt"] = datetime.datetime.now().strftime('%Y-%m-%d')
+        tags["GeneratedAt"] = generated_date or datetime.datetime.now().strftime('%Y-%m-%d')
     
-    # Remove empty tags
-    return {k: v for k, v in tags.items() if v and v != 'TBD'}
+    return tags
 
-def generate_vm_tags(vm_data: Dict, global_data: Dict[str, Any], hostname: str) -> Dict[str, str]:
-    """Generate VM-specific tags."""
-    tags = generate_resource_tags(global_data)  # Start with global tags
+def generate_vm_tags(vm_data: Dict, base_tags: Dict[str, str], global_data: Dict[str, Any],
+                     hostname: str, vm_env: Optional[str] = None) -> Dict[str, str]:
+    """Generate VM-specific tags on top of the global tags from generate_resource_tags."""
+    tags = dict(base_tags)  # Start with global tags
     
     # Add VM-specific tags
     tags.update({
         "Name": hostname,
         "Role": infer_vm_role(hostname),
-        "Environment": extract_vm_environment(vm_data, global_data),
+        "Environment": vm_env or extract_vm_environment(vm_data, global_data),
     })
     
     # Add optional VM-specific information
@@ -270,65 +367,49 @@ def generate_vm_tags(vm_data: Dict, global_data: Dict[str, Any], hostname: str)
 
 def infer_vm_role(hostname: str) -> str:
     """Infer VM role from hostname."""
-    hostname_lower = hostname.lower()
-    
-    if any(role in hostname_lower for role in ['web', 'www', 'frontend', 'ui']):
-        return 'web'
-    elif any(role in hostname_lower for role in ['api', 'app', 'application', 'backend']):
-        return 'application'
-    elif any(role in hostname_lower for role in ['db', 'database', 'sql', 'mysql', 'postgres']):
-        return 'database'
-    elif any(role in hostname_lower for role in ['cache', 'redis', 'memcache']):
-        return 'cache'
-    elif any(role in hostname_lower for role in ['lb', 'loadbalancer', 'proxy']):
-        return 'loadbalancer'
-    else:
-        return 'compute'
+    found = {match.lastgroup for match in _ROLE_RE.finditer(hostname.lower())}
+    return next((role for role in _ROLE_ORDER if role in found), 'compute')
 
 def extract_networking_config(vm_instances: List[Dict]) -> Dict[str, Any]:
     """Extract networking configuration from VM instances."""
-    networking_config = {
-        "virtual_networks": set(),
-        "subnets": set(), 
-        "network_security_groups": set()
-    }
+    virtual_networks, subnets, network_security_groups = set(), set(), set()
+    add_vnet, add_subnet, add_nsg = virtual_networks.add, subnets.add, network_security_groups.add
     
     for vm in vm_instances:
-        if vm.get('Virtual Network'):
-            networking_config["virtual_networks"].add(vm['Virtual Network'])
-        if vm.get('Subnet'):
-            networking_config["subnets"].add(vm['Subnet'])
-        if vm.get('Network Security Group'):
-            networking_config["network_security_groups"].add(vm['Network Security Group'])
+        vnet = vm.get('Virtual Network')
+        if vnet:
+            add_vnet(vnet)
+        subnet = vm.get('Subnet')
+        if subnet:
+            add_subnet(subnet)
+        nsg = vm.get('Network Security Group')
+        if nsg:
+            add_nsg(nsg)
     
     # Convert sets to sorted lists for JSON serialization
     return {
-        "virtual_networks": sorted(list(networking_config["virtual_networks"])),
-        "subnets": sorted(list(networking_config["subnets"])),
-        "network_security_groups": sorted(list(networking_config["network_security_groups"]))
+        "virtual_networks": sorted(virtual_networks),
+        "subnets": sorted(subnets),
+        "network_security_groups": sorted(network_security_groups)
     }
 
 # Test and utility functions
-def validate_terraform_json(json_data: Dict[str, Any]) -> List[str]:
-    """Validate the generated Terraform JSON structure."""
-    errors = []
-    
-    required_fields = ['project_name', 'application_name', 'virtual_machines']
-    for field in required_fields:
+def _iter_validation_errors(json_data: Dict[str, Any]) -> Iterator[str]:
+    """Yield validation errors for the generated Terraform JSON structure."""
+    for field in ('project_name', 'application_name', 'virtual_machines'):
         if field not in json_data:
-            errors.append(f"Missing required field: {field}")
+            yield f"Missing required field: {field}"
     
     # Validate VM configurations
-    for i, vm in enumerate(json_data.get('virtual_machines', [])):
-        vm_errors = []
+    for i, vm in enumerate(json_data.get('virtual_machines', ())):
         if not vm.get('name'):
-            vm_errors.append(f"VM {i}: Missing name")
+            yield f"VM {i}: Missing name"
         if not vm.get('vm_size'):
-            vm_errors.append(f"VM {i}: Missing vm_size")
-        
-        errors.extend(vm_errors)
-    
-    return errors
+            yield f"VM {i}: Missing vm_size"
+
+def validate_terraform_json(json_data: Dict[str, Any]) -> List[str]:
+    """Validate the generated Terraform JSON structure."""
+    return list(_iter_validation_errors(json_data))
 
 if __name__ == '__main__':
     """Test the terraform JSON generator with sample data."""
@@ -372,11 +453,11 @@ if __name__ == '__main__':
     
     # Test the generation
     output_file = "test_terraform_variables.json"
-    success = create_terraform_json(test_data, output_file)
+    nbytes = create_terraform_json(test_data, output_file)
     
-    if success:
+    if nbytes:
         print(f"\nTest completed successfully!")
-        print(f"Generated file: {output_file}")
+        print(f"Generated file: {output_file} ({nbytes:,} bytes)")
         
         # Validate the generated JSON
         with open(output_file, 'r') as f:
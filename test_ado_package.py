@@ -8,6 +8,22 @@ import os
 import sys
 from automation_pipeline import AutomationPipeline
 
+EXCEL_SUFFIXES = ('.xlsx', '.xls', '.xlsm')
+
+def _print_tree(path, level=0):
+    """Print a directory and its files, then its subdirectories, one scandir per directory."""
+    print(f"{'  ' * level}{os.path.basename(path)}/")
+    with os.scandir(path) as it:
+        entries = list(it)
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir():
+            subdirs.append(entry.path)
+        else:
+            print(f"{'  ' * (level + 1)}{entry.name}")
+    for subdir in subdirs:
+        _print_tree(subdir, level + 1)
+
 def test_ado_package():
     """Test the Azure DevOps-focused deployment package functionality."""
     
@@ -24,8 +40,9 @@ def test_ado_package():
         return False
     
     # Check for Excel files
-    import glob
-    excel_files = glob.glob(os.path.join(sourcefiles_dir, "*.xls*"))
+    with os.scandir(sourcefiles_dir) as entries:
+        excel_files = [entry.path for entry in entries
+                       if entry.is_file() and entry.name.endswith(EXCEL_SUFFIXES)]
     if not excel_files:
         print(f"No Excel files found in {sourcefiles_dir} directory.")
         print("Please place your Excel files in the sourcefiles directory and run again.")
@@ -54,13 +71,7 @@ def test_ado_package():
         
         print(f"\nPackage Contents:")
         if os.path.exists("output_package"):
-            for root, dirs, files in os.walk("output_package"):
-                level = root.replace("output_package", "").count(os.sep)
-                indent = "  " * level
-                print(f"{indent}{os.path.basename(root)}/")
-                subindent = "  " * (level + 1)
-                for file in files:
-                    print(f"{subindent}{file}")
+            _print_tree("output_package")
         
         print(f"\nAzure DevOps Integration:")
         print(f"1. Copy the output_package contents to your ADO repository")
@@ -87,13 +98,14 @@ def test_ado_package():
         
         return False
 
-def show_ado_package_structure():
-    """Show the expected ADO package structure."""
-    print("\n" + "=" * 80)
-    print("AZURE DEVOPS PACKAGE STRUCTURE")
-    print("=" * 80)
-    
-    structure = """
+_BAR = "=" * 80
+
+# Expected package layout report, printed as one block by show_ado_package_structure
+_STRUCTURE_REPORT = f"""
+{_BAR}
+AZURE DEVOPS PACKAGE STRUCTURE
+{_BAR}
+
 output_package/
 ├── main.tf                          # Main Terraform resources
 ├── variables.tf                     # Variable definitions
@@ -107,23 +119,26 @@ output_package/
 │   └── validate.sh                  # Configuration validation script
 └── docs/
     └── DEPLOYMENT_GUIDE.md          # Comprehensive deployment guide
+
+
+Azure DevOps Integration Features:
+  * Complete Terraform configuration ready for ADO
+  * Terraform tasks compatible (Init, Plan, Apply, Destroy)
+  * Variable files for easy configuration
+  * Validation script for pipeline validation
+  * Comprehensive documentation for ADO setup
+  * Git-ready with proper .gitignore
+
+ADO Pipeline Tasks:
+  1. Terraform Init Task
+  2. Terraform Plan Task
+  3. Terraform Apply Task
+  4. Terraform Destroy Task (optional)
 """
-    
-    print(structure)
-    
-    print("\nAzure DevOps Integration Features:")
-    print("  * Complete Terraform configuration ready for ADO")
-    print("  * Terraform tasks compatible (Init, Plan, Apply, Destroy)")
-    print("  * Variable files for easy configuration")
-    print("  * Validation script for pipeline validation")
-    print("  * Comprehensive documentation for ADO setup")
-    print("  * Git-ready with proper .gitignore")
-    
-    print("\nADO Pipeline Tasks:")
-    print("  1. Terraform Init Task")
-    print("  2. Terraform Plan Task")
-    print("  3. Terraform Apply Task")
-    print("  4. Terraform Destroy Task (optional)")
+
+def show_ado_package_structure():
+    """Show the expected ADO package structure."""
+    sys.stdout.write(_STRUCTURE_REPORT)
 
 if __name__ == "__main__":
     print("Excel to Terraform Azure DevOps Package Generator")
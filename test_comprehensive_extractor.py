@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Test Comprehensive Extractor Output
+===================================
+Check that the sheet data extracted from LLDtest.xlsm still matches the
+committed converter output (LLDtest_complete_conversion.json).
+"""
+
+import io
+import json
+import contextlib
+
+import pytest
+
+import comprehensive_excel_extractor
+from comprehensive_excel_extractor import ComprehensiveExcelExtractor
+from excel_to_json_converter import _dumps
+
+EXCEL_FILE = "LLDtest.xlsm"
+BASELINE_JSON = "LLDtest_complete_conversion.json"
+
+@pytest.mark.parametrize("use_calamine", [True, False])
+def test_sheet_data_matches_baseline(monkeypatch, use_calamine):
+    """Sheet values must match what pd.read_excel(header=None) produced."""
+    if not use_calamine:
+        monkeypatch.setattr(comprehensive_excel_extractor, "CalamineWorkbook", None)
+
+    with open(BASELINE_JSON, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    extractor = ComprehensiveExcelExtractor(EXCEL_FILE)
+    with contextlib.redirect_stdout(io.StringIO()):
+        data = extractor.extract_all(values_only=True)
+
+    # round-trip through the converter's encoder so both sides are plain JSON
+    sheets = json.loads(_dumps(data['sheets']))
+
+    assert sorted(sheets) == sorted(baseline['sheets'])
+    for sheet_name, sheet_data in baseline['sheets'].items():
+        for key in ('raw_data', 'dimensions', 'tables', 'key_value_pairs', 'structured_data'):
+            assert sheets[sheet_name][key] == sheet_data[key], f"{sheet_name}: {key} differs"
+
+    total_kv = sum(len(s.get('key_value_pairs', {})) for s in sheets.values())
+    assert total_kv == baseline['processing_summary']['total_key_value_pairs']
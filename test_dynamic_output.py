@@ -6,16 +6,17 @@ Test script to demonstrate the dynamic output folder creation based on
 Subscription field and timestamp.
 """
 
-import os
-import json
 import sys
 from datetime import datetime
+
+import pytest
+
 from automation_pipeline import AutomationPipeline
 
 def create_test_json_data():
-    """Create test JSON data with subscription information."""
+    """Create test JSON data with subscription information (kept in memory)."""
     
-    test_data = {
+    return {
         "sheets": {
             "Resources": {
                 "key_value_pairs": {
@@ -47,14 +48,6 @@ def create_test_json_data():
             }
         }
     }
-    
-    # Write test JSON file
-    test_json_file = "test_subscription_data.json"
-    with open(test_json_file, 'w') as f:
-        json.dump(test_data, f, indent=2)
-    
-    print(f"Created test JSON file: {test_json_file}")
-    return test_json_file
 
 def test_dynamic_output_creation():
     """Test the dynamic output directory creation."""
@@ -63,7 +56,7 @@ def test_dynamic_output_creation():
     print("=" * 50)
     
     # Create test JSON data
-    test_json_file = create_test_json_data()
+    test_data = create_test_json_data()
     
     try:
         # Create automation pipeline instance
@@ -72,33 +65,18 @@ def test_dynamic_output_creation():
         # Test the dynamic output directory creation
         test_excel_file = "test_data.xlsx"
         
-        print(f"\nTesting with JSON file: {test_json_file}")
+        print(f"\nTesting with in-memory JSON data")
         print(f"Excel file: {test_excel_file}")
         
         # Test the dynamic directory creation method
-        output_dir = pipeline._create_dynamic_output_directory(test_json_file, test_excel_file)
+        output_dir = pipeline._create_dynamic_output_directory(test_data, test_excel_file)
         
         print(f"\nGenerated output directory: {output_dir}")
         
         # Test subscription extraction
-        subscription = pipeline._extract_subscription_from_json(test_json_file)
+        subscription = pipeline._extract_subscription_from_json(test_data)
         print(f"Extracted subscription: {subscription}")
         
-        # Test directory name sanitization
-        test_names = [
-            "subscription-dev-001",
-            "My Test Subscription",
-            "sub@#$%^&*()script",
-            "very-long-subscription-name-that-exceeds-fifty-characters-limit",
-            "",
-            "   spaces   "
-        ]
-        
-        print(f"\nTesting directory name sanitization:")
-        for name in test_names:
-            sanitized = pipeline._sanitize_directory_name(name)
-            print(f"  '{name}' -> '{sanitized}'")
-        
         # Test different configuration patterns
         print(f"\nTesting different naming patterns:")
         
@@ -124,12 +102,22 @@ def test_dynamic_output_creation():
         print(f"ERROR: Test failed: {e}")
         import traceback
         traceback.print_exc()
-    
-    finally:
-        # Clean up test file
-        if os.path.exists(test_json_file):
-            os.remove(test_json_file)
-            print(f"\nCleaned up test file: {test_json_file}")
+
+@pytest.mark.parametrize("name,expected", [
+    ("subscription-dev-001", "subscription-dev-001"),
+    ("My Test Subscription", "My_Test_Subscription"),
+    ("sub@#$%^&*()script", "sub_script"),
+    ("very-long-subscription-name-that-exceeds-fifty-characters-limit",
+     "very-long-subscription-name-that-exceeds-fifty-cha"),
+    ("", "unknown"),
+    ("   spaces   ", "spaces"),
+    ("a__b  c", "a_b_c"),
+    ("__x__", "x"),
+])
+def test_sanitize_directory_name(name, expected):
+    """Test directory name sanitization."""
+    pipeline = AutomationPipeline("automation_config.json")
+    assert pipeline._sanitize_directory_name(name) == expected
 
 def test_configuration_options():
     """Test different configuration options for dynamic output."""
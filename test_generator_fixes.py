@@ -8,6 +8,15 @@ Quick test to verify that the generator correctly extracts values from JSON raw_
 import json
 from enhanced_terraform_generator_v2 import EnhancedTerraformGeneratorV2
 
+# (key, sheet, default, expected) for each raw_data lookup
+RAW_VALUE_CHECKS = (
+    ('sku_name', 'Build_ENV', 'standard', "standard"),
+    ('soft_delete_retention_days', 'Build_ENV', 90, 90),
+    ('public_network_access', 'Build_ENV', 1, 1),
+    ('vm_list.vm1.os_disk_size', 'Resources', None, 10),
+    ('vm_list.vm1.ip_allocation', 'Resources', None, "Static"),
+)
+
 def test_raw_data_extraction():
     """Test that raw_data cache is working correctly."""
     
@@ -31,35 +40,14 @@ def test_raw_data_extraction():
     print("✓ Raw data cache built")
     print()
     
-    # Test key vault extraction
-    print("Testing Key Vault value extraction:")
-    kvlt_sku = generator._get_raw_value('sku_name', 'Build_ENV', 'standard')
-    kvlt_retention = generator._get_raw_value('soft_delete_retention_days', 'Build_ENV', 90)
-    kvlt_public_access = generator._get_raw_value('public_network_access', 'Build_ENV', 1)
-    
-    print(f"  sku_name: {kvlt_sku} (expected: 'standard')")
-    print(f"  soft_delete_retention_days: {kvlt_retention} (expected: 90)")
-    print(f"  public_network_access: {kvlt_public_access} (expected: 1)")
-    
-    # Validate
-    assert kvlt_sku == "standard", f"sku_name wrong: {kvlt_sku}"
-    assert kvlt_retention == 90, f"soft_delete_retention_days wrong: {kvlt_retention}"
-    assert kvlt_public_access == 1, f"public_network_access wrong: {kvlt_public_access}"
-    print("✓ Key Vault values correct")
-    print()
-    
-    # Test VM extraction (VM config is in Resources sheet, not Build_ENV)
-    print("Testing VM value extraction:")
-    vm_os_disk_size = generator._get_raw_value('vm_list.vm1.os_disk_size', 'Resources')
-    vm_ip_allocation = generator._get_raw_value('vm_list.vm1.ip_allocation', 'Resources')
-    
-    print(f"  os_disk_size: {vm_os_disk_size} (expected: 10)")
-    print(f"  ip_allocation: {vm_ip_allocation} (expected: 'Static')")
-    
-    # Validate
-    assert vm_os_disk_size == 10, f"os_disk_size wrong: {vm_os_disk_size}"
-    assert vm_ip_allocation == "Static", f"ip_allocation wrong: {vm_ip_allocation}"
-    print("✓ VM values correct")
+    # Test key vault and VM extraction (VM config is in Resources sheet, not Build_ENV)
+    print("Testing Key Vault and VM value extraction:")
+    get = generator._get_raw_value
+    for key, sheet, default, expected in RAW_VALUE_CHECKS:
+        got = get(key, sheet, default)
+        print(f"  {key}: {got!r} (expected: {expected!r})")
+        assert got == expected, f"{key} wrong: {got}"
+    print("✓ Key Vault and VM values correct")
     print()
     
     # Test location extraction
@@ -9,12 +9,56 @@ This tool attempts to extract the actual VBA source code from Excel files.
 import os
 import zipfile
 import struct
-import json
+import mmap
+import re
+import shutil
+import tempfile
 from typing import Dict, Any, List, Optional
 import warnings
 
+from excel_io import _dumps
+
 warnings.filterwarnings('ignore')
 
+# Common VBA keywords that might indicate code structure
+VBA_KEYWORDS = (
+    b'Sub ', b'Function ', b'Private Sub', b'Public Sub',
+    b'End Sub', b'End Function', b'Dim ', b'Set ', b'If ',
+    b'Then', b'Else', b'End If', b'For ', b'Next', b'Do ',
+    b'Loop', b'While ', b'Wend', b'Select Case', b'End Select'
+)
+
+# module names often appear as plain strings in vbaProject.bin
+VBA_MODULE_PATTERNS = (b'Module', b'Sheet', b'Workbook', b'Form', b'Class')
+
+# leading bytes of a ZIP archive (regular, empty and spanned)
+ZIP_SIGNATURES = (b'PK\x03\x04', b'PK\x05\x06', b'PK\x07\x08')
+
+# archive members whose names suggest VBA content
+VBA_RELATED_NAME_RE = re.compile(r'vba|macro|vbproject', re.IGNORECASE)
+
+# latin-1 bytes that are neither printable nor whitespace, dropped from readable_sample
+_UNREADABLE_BYTES = bytes(b for b in range(256) if not (chr(b).isprintable() or chr(b).isspace()))
+
+def _count_keywords(buf, keywords, chunk_size: int = 1 << 20) -> Dict[bytes, int]:
+    """
+    Count each keyword in a bytes-like buffer (bytes or mmap) in one pass.
+    
+    Each chunk is copied once and counted in C with bytes.count, bounded so
+    a keyword starting in the overlap is left for the next chunk. This only
+    matches a whole-buffer count for keywords that cannot overlap themselves,
+    which holds for VBA_KEYWORDS and VBA_MODULE_PATTERNS.
+    """
+    counts = dict.fromkeys(keywords, 0)
+    overlap = max(map(len, keywords)) - 1
+    size = len(buf)
+    for start in range(0, size, chunk_size):
+        chunk = buf[start:start + chunk_size + overlap]
+        limit = min(chunk_size, size - start)
+        for keyword in keywords:
+            counts[keyword] += chunk.count(keyword, 0, limit + len(keyword) - 1)
+    return counts
+
 class VBAMacroExtractor:
     """Extract VBA macros from Excel files."""
     
@@ -40,62 +84,71 @@ class VBAMacroExtractor:
             'extraction_notes': []
         }
         
-        try:
-            # Check if file is a ZIP-based format (Excel 2007+)
-            if self._is_zip_format():
-                self._extract_from_zip()
-            else:
-                # For older .xls files, we would need different approach
-                self.extracted_macros['extraction_notes'].append(
-                    "File appears to be in older Excel format - VBA extraction may be limited"
-                )
-                
-        except Exception as e:
-            self.extracted_macros['extraction_error'] = str(e)
-            print(f"Error extracting VBA: {e}")
+        # Check if file is a ZIP-based format (Excel 2007+)
+        if not self._is_zip_format():
+            # For older .xls files, we would need different approach
+            self.extracted_macros['extraction_notes'].append(
+                "File appears to be in older Excel format - VBA extraction may be limited"
+            )
+            return self.extracted_macros
+        
+        # _extract_from_zip records ZIP read failures as zip_extraction_error
+        self._extract_from_zip()
         
         return self.extracted_macros
     
     def _is_zip_format(self) -> bool:
         """Check if file is ZIP-based (Excel 2007+)."""
+        # only the local-file / end-of-central-directory signature is needed;
+        # _extract_from_zip does the one real ZipFile open
         try:
-            with zipfile.ZipFile(self.file_path, 'r') as zip_file:
-                return True
-        except:
+            with open(self.file_path, 'rb') as f:
+                return f.read(4) in ZIP_SIGNATURES
+        except OSError:
             return False
     
     def _extract_from_zip(self):
         """Extract VBA from ZIP-based Excel file."""
         try:
             with zipfile.ZipFile(self.file_path, 'r') as zip_file:
-                file_list = zip_file.namelist()
-                
-                # Look for VBA project file
+                # Look for the VBA project file and VBA-related members in one pass
                 vba_project_file = None
-                for file_name in file_list:
-                    if file_name == 'xl/vbaProject.bin':
+                vba_related = []
+                # infolist() returns the archive's own entry list; namelist() builds a copy
+                for info in zip_file.infolist():
+                    file_name = info.filename
+                    if vba_project_file is None and file_name == 'xl/vbaProject.bin':
                         vba_project_file = file_name
-                        break
+                    if VBA_RELATED_NAME_RE.search(file_name):
+                        vba_related.append(file_name)
                 
                 if vba_project_file:
                     print("  Found VBA project file")
                     
-                    # Read the VBA project file
-                    vba_data = zip_file.read(vba_project_file)
-                    
-                    # Store basic info about the VBA project
-                    self.extracted_macros['vba_project'] = {
-                        'filename': vba_project_file,
-                        'size_bytes': len(vba_data),
-                        'format': 'binary',
-                        'note': 'VBA project is in binary format - source code extraction is complex'
-                    }
-                    
-                    # Try to extract some readable information
-                    self._analyze_vba_binary(vba_data)
+                    # Spool the VBA project file to disk and map it rather than
+                    # holding the whole decompressed member in memory
+                    with zip_file.open(vba_project_file) as src, tempfile.TemporaryFile() as dst:
+                        shutil.copyfileobj(src, dst, 1 << 20)
+                        dst.flush()
+                        size_bytes = os.fstat(dst.fileno()).st_size
+                        
+                        # Store basic info about the VBA project
+                        self.extracted_macros['vba_project'] = {
+                            'filename': vba_project_file,
+                            'size_bytes': size_bytes,
+                            'format': 'binary',
+                            'note': 'VBA project is in binary format - source code extraction is complex'
+                        }
+                        
+                        # Try to extract some readable information
+                        if size_bytes:  # mmap cannot map an empty file
+                            with mmap.mmap(dst.fileno(), 0, access=mmap.ACCESS_READ) as vba_data:
+                                self._analyze_vba_binary(vba_data)
+                        else:
+                            self._analyze_vba_binary(b'')
                     
                     # Look for other VBA-related files
-                    self._find_vba_related_files(zip_file, file_list)
+                    self._find_vba_related_files(zip_file, vba_related)
                     
                 else:
                     print("  No VBA project file found")
@@ -105,73 +158,57 @@ class VBAMacroExtractor:
             self.extracted_macros['zip_extraction_error'] = str(e)
             print(f"Error reading ZIP file: {e}")
     
-    def _analyze_vba_binary(self, vba_data: bytes):
-        """Analyze VBA binary data to extract some information."""
+    def _analyze_vba_binary(self, vba_data):
+        """Analyze VBA binary data (bytes or a read-only mmap) to extract some information."""
         try:
             # VBA projects are stored in a complex binary format
             # We can try to extract some basic information
-            
-            # Look for module names (they're often stored as strings)
-            vba_text = vba_data.decode('latin-1', errors='ignore')
-            
-            # Common VBA keywords that might indicate code structure
-            vba_keywords = [
-                'Sub ', 'Function ', 'Private Sub', 'Public Sub',
-                'End Sub', 'End Function', 'Dim ', 'Set ', 'If ',
-                'Then', 'Else', 'End If', 'For ', 'Next', 'Do ',
-                'Loop', 'While ', 'Wend', 'Select Case', 'End Select'
-            ]
+            # scan the raw bytes; latin-1 maps bytes 1:1 so no decoded copy is needed
+            # (mmap has no count() and its "in" tests single bytes, so count in chunks);
+            # keywords and module names share the one pass
+            counts = _count_keywords(vba_data, VBA_KEYWORDS + VBA_MODULE_PATTERNS)
             
             found_keywords = {}
-            for keyword in vba_keywords:
-                count = vba_text.count(keyword)
+            for keyword in VBA_KEYWORDS:
+                count = counts[keyword]
                 if count > 0:
-                    found_keywords[keyword] = count
+                    found_keywords[keyword.decode('latin-1')] = count
             
             if found_keywords:
                 self.extracted_macros['vba_project']['detected_keywords'] = found_keywords
                 print(f"  Detected VBA keywords: {found_keywords}")
             
             # Try to find module names (they often appear as strings)
-            module_patterns = ['Module', 'Sheet', 'Workbook', 'Form', 'Class']
-            found_modules = []
-            
-            for pattern in module_patterns:
-                if pattern in vba_text:
-                    found_modules.append(pattern)
+            found_modules = [pattern.decode('latin-1') for pattern in VBA_MODULE_PATTERNS if counts[pattern]]
             
             if found_modules:
                 self.extracted_macros['vba_project']['detected_module_types'] = found_modules
                 print(f"  Detected module types: {found_modules}")
             
             # Store a sample of the readable text (first 1000 characters)
-            readable_sample = ''.join(c for c in vba_text[:1000] if c.isprintable() or c.isspace())
+            readable_sample = vba_data[:1000].translate(None, _UNREADABLE_BYTES).decode('latin-1')
             self.extracted_macros['vba_project']['readable_sample'] = readable_sample
             
         except Exception as e:
             self.extracted_macros['vba_project']['analysis_error'] = str(e)
             print(f"Error analyzing VBA binary: {e}")
     
-    def _find_vba_related_files(self, zip_file: zipfile.ZipFile, file_list: List[str]):
-        """Find other VBA-related files in the Excel file."""
-        vba_related = []
-        
-        for file_name in file_list:
-            if any(keyword in file_name.lower() for keyword in ['vba', 'macro', 'vbproject']):
-                vba_related.append(file_name)
-        
+    def _find_vba_related_files(self, zip_file: zipfile.ZipFile, vba_related: List[str]):
+        """Record the VBA-related files found in the Excel file."""
         if vba_related:
-            self.extracted_macros['vba_project']['related_files'] = vba_related
+            vba_project = self.extracted_macros['vba_project']
+            vba_project['related_files'] = vba_related
             print(f"  Found VBA-related files: {vba_related}")
             
             # Try to read any XML files that might contain VBA info
-            for file_name in vba_related:
-                if file_name.endswith('.xml'):
-                    try:
-                        xml_content = zip_file.read(file_name).decode('utf-8', errors='ignore')
-                        self.extracted_macros['vba_project'][f'xml_{file_name.replace("/", "_")}'] = xml_content
-                    except Exception as e:
-                        print(f"  Could not read {file_name}: {e}")
+            # (a bad member is reported and skipped without losing the others)
+            for file_name in [name for name in vba_related if name.endswith('.xml')]:
+                try:
+                    raw = zip_file.read(file_name)
+                except Exception as e:
+                    print(f"  Could not read {file_name}: {e}")
+                    continue
+                vba_project[f'xml_{file_name.replace("/", "_")}'] = raw.decode('utf-8', errors='ignore')
     
     def export_macros_to_json(self, output_file: str = None) -> str:
         """Export extracted macro information to JSON."""
@@ -180,8 +217,8 @@ class VBAMacroExtractor:
             output_file = f"{base_name}_vba_macros.json"
         
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(self.extracted_macros, f, indent=2, ensure_ascii=False)
+            with open(output_file, 'wb') as f:
+                f.write(_dumps(self.extracted_macros))
             
             file_size = os.path.getsize(output_file)
             print(f"SUCCESS: Exported VBA macro info to: {output_file} ({file_size:,} bytes)")
@@ -193,13 +230,14 @@ class VBAMacroExtractor:
     
     def get_macro_summary(self) -> Dict[str, Any]:
         """Get summary of extracted macro information."""
+        vba_project = self.extracted_macros.get('vba_project') or {}
         summary = {
             'file_name': self.file_name,
-            'has_vba_project': bool(self.extracted_macros.get('vba_project', {}).get('filename')),
-            'vba_project_size': self.extracted_macros.get('vba_project', {}).get('size_bytes', 0),
-            'detected_keywords': len(self.extracted_macros.get('vba_project', {}).get('detected_keywords', {})),
-            'detected_module_types': len(self.extracted_macros.get('vba_project', {}).get('detected_module_types', [])),
-            'extraction_notes': len(self.extracted_macros.get('extraction_notes', []))
+            'has_vba_project': bool(vba_project.get('filename')),
+            'vba_project_size': vba_project.get('size_bytes', 0),
+            'detected_keywords': len(vba_project.get('detected_keywords', ())),
+            'detected_module_types': len(vba_project.get('detected_module_types', ())),
+            'extraction_notes': len(self.extracted_macros.get('extraction_notes', ()))
         }
         
         return summary
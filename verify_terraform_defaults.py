@@ -7,131 +7,155 @@ and reports all discrepancies.
 """
 
 import json
-import re
-from typing import Dict, Any, List
+import sys
+from typing import Any, Callable, Dict, List
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON parser
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # optional lazy JSON parser
+    simdjson = None
+
+# the only Build_ENV lists the checks read
+BUILD_ENV_LISTS = ('structured_data', 'raw_data')
+
+# field -> value the JSON must hold
+EXPECTED_VALUES = (
+    ('admin_username', 'cisadmin'),
+    ('soft_delete_retention_days', 90),
+    ('sku_name', 'standard'),
+)
+
+VALID_LOCATIONS = ("WEST US", "WEST US 2", "WEST US 3", "EAST US")
+_VALID_LOCATION_SET = frozenset(VALID_LOCATIONS)
+
+# field -> JSON flag value that contradicts the variables.tf default
+FLAG_MISMATCHES = (
+    ('public_network_access', 1, 'false'),
+)
 
 def load_json_data(json_file: str) -> Dict:
     """Load the comprehensive Excel JSON data."""
-    with open(json_file, 'r') as f:
-        return json.load(f)
+    with open(json_file, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
-def extract_value_from_json(data: Dict, field_name: str, context: str = None) -> Any:
-    """Extract a specific field value from the JSON structure."""
-    # Handle nested data structure
-    sheets = data.get('sheets', {})
-    build_env = sheets.get('Build_ENV', {})
+def load_build_env(json_file: str) -> Dict:
+    """
+    Load just the Build_ENV lists the checks need.
+    
+    With simdjson the rest of the document is never turned into Python
+    objects; otherwise the whole file is parsed.
+    """
+    if simdjson is None:
+        data = load_json_data(json_file)
+        # Handle nested data structure
+        return (data.get('sheets') or {}).get('Build_ENV') or {}
+    
+    parser = simdjson.Parser()
+    doc = parser.load(json_file)
+    sheets = doc.get('sheets') if isinstance(doc, simdjson.Object) else None
+    build_env = sheets.get('Build_ENV') if isinstance(sheets, simdjson.Object) else None
+    if not isinstance(build_env, simdjson.Object):
+        return {}
+    
+    lists = {}
+    for key in BUILD_ENV_LISTS:
+        value = build_env.get(key)
+        if isinstance(value, simdjson.Array):
+            lists[key] = value.as_list()
+    return lists
+
+def build_field_index(build_env: Dict) -> Dict[Any, Any]:
+    """
+    Index the Build_ENV field values once so each check is a dict lookup.
     
-    # Look in structured data
-    structured = build_env.get('structured_data', [])
-    for item in structured:
-        if isinstance(item, dict):
-            var_name = item.get('Terraform Variable')
-            if var_name == field_name:
-                return item.get('Value')
+    structured_data ('Terraform Variable' -> 'Value') wins over raw_data
+    (column '1' -> column '2'); within each the first occurrence wins.
+    """
+    index = {}
     
     # Look in raw data
-    raw_data = build_env.get('raw_data', [])
-    for row in raw_data:
-        if isinstance(row, dict) and row.get('1') == field_name:
-            return row.get('2')
-    
-    return None
-
-def check_key_vault_defaults(json_data: Dict) -> List[str]:
-    """Check Key Vault defaults."""
-    issues = []
+    for row in build_env.get('raw_data', ()):
+        if isinstance(row, dict):
+            index.setdefault(row.get('1'), row.get('2'))
     
-    # Check soft_delete_retention_days
-    json_value = extract_value_from_json(json_data, 'soft_delete_retention_days')
-    print(f"soft_delete_retention_days from JSON: {json_value}")
-    if json_value != 90:
-        issues.append(f"❌ soft_delete_retention_days: Expected 90 from JSON, got {json_value}")
-    
-    # Check sku_name
-    json_value = extract_value_from_json(json_data, 'sku_name')
-    print(f"sku_name from JSON: {json_value}")
-    if json_value != "standard":
-        issues.append(f"❌ sku_name: Expected 'standard' from JSON, got {json_value}")
-    
-    # Check public_network_access
-    json_value = extract_value_from_json(json_data, 'public_network_access')
-    print(f"public_network_access from JSON: {json_value}")
-    # Value of 1 typically means True/enabled
-    if json_value == 1:
-        issues.append(f"❌ public_network_access: JSON has 1 (true), but variables.tf default is false")
+    # Look in structured data
+    structured = {}
+    for item in build_env.get('structured_data', ()):
+        if isinstance(item, dict):
+            structured.setdefault(item.get('Terraform Variable'), item.get('Value'))
+    index.update(structured)
     
-    return issues
+    return index
 
-def check_location(json_data: Dict) -> List[str]:
-    """Check location field."""
+def verify(field_index: Dict, log: Callable[[str], Any] = print) -> List[str]:
+    """Check every expected field against the indexed JSON values."""
     issues = []
     
-    json_value = extract_value_from_json(json_data, 'location')
-    print(f"location from JSON: {json_value}")
+    for field, expected in EXPECTED_VALUES:
+        json_value = field_index.get(field)
+        log(f"{field} from JSON: {json_value}")
+        if json_value != expected:
+            issues.append(f"❌ {field}: Expected {expected!r} from JSON, got {json_value}")
+        else:
+            issues.append(f"✓ {field}: Correct ({expected!r})")
     
     # Check if it's a valid location
-    valid_locations = ["WEST US", "WEST US 2", "WEST US 3", "EAST US"]
-    if json_value not in valid_locations:
-        issues.append(f"❌ location: '{json_value}' is not a valid Azure location. Expected one of {valid_locations}")
+    json_value = field_index.get('location')
+    log(f"location from JSON: {json_value}")
+    if json_value not in _VALID_LOCATION_SET:
+        issues.append(f"❌ location: '{json_value}' is not a valid Azure location. Expected one of {list(VALID_LOCATIONS)}")
     
-    return issues
-
-def check_admin_username(json_data: Dict) -> List[str]:
-    """Check admin_username field."""
-    issues = []
-    
-    json_value = extract_value_from_json(json_data, 'admin_username')
-    print(f"admin_username from JSON: {json_value}")
-    
-    if json_value != "cisadmin":
-        issues.append(f"❌ admin_username: Expected 'cisadmin' from JSON, got {json_value}")
-    else:
-        issues.append(f"✓ admin_username: Correct ('cisadmin')")
+    # Value of 1 typically means True/enabled
+    for field, json_flag, variables_default in FLAG_MISMATCHES:
+        json_value = field_index.get(field)
+        log(f"{field} from JSON: {json_value}")
+        if json_value == json_flag:
+            issues.append(f"❌ {field}: JSON has {json_flag} (true), but variables.tf default is {variables_default}")
     
     return issues
 
 def main():
     """Main verification function."""
-    print("=" * 80)
-    print("TERRAFORM DEFAULT VALUES VERIFICATION")
-    print("=" * 80)
-    print()
-    
-    json_file = 'comprehensive_excel_data.json'
-    
-    print("Loading JSON data...")
-    data = load_json_data(json_file)
-    print("JSON data loaded successfully")
-    print()
+    # collect the report and write it once at the end
+    out = []
+    log = out.append
     
-    all_issues = []
+    log("=" * 80)
+    log("TERRAFORM DEFAULT VALUES VERIFICATION")
+    log("=" * 80)
+    log("")
     
-    print("Checking admin_username...")
-    all_issues.extend(check_admin_username(data))
-    print()
+    json_file = 'comprehensive_excel_data.json'
     
-    print("Checking location...")
-    all_issues.extend(check_location(data))
-    print()
+    log("Loading JSON data...")
+    field_index = build_field_index(load_build_env(json_file))
+    log("JSON data loaded successfully")
+    log("")
     
-    print("Checking Key Vault defaults...")
-    all_issues.extend(check_key_vault_defaults(data))
-    print()
+    log("Checking defaults...")
+    all_issues = verify(field_index, log)
+    log("")
     
     # Summary
-    print("=" * 80)
-    print("SUMMARY OF ISSUES")
-    print("=" * 80)
+    log("=" * 80)
+    log("SUMMARY OF ISSUES")
+    log("=" * 80)
     
     if all_issues:
-        for issue in all_issues:
-            print(issue)
+        out.extend(all_issues)
     else:
-        print("✓ No issues found!")
+        log("✓ No issues found!")
+    
+    log("")
+    log(f"Total issues found: {sum(1 for i in all_issues if i.startswith('❌'))}")
     
-    print()
-    print(f"Total issues found: {len([i for i in all_issues if i.startswith('❌')])}")
+    sys.stdout.write('\n'.join(out) + '\n')
 
 if __name__ == "__main__":
     main()
-